@@ -161,6 +161,36 @@ class AudioPlayer:
                     sound_obj.set_volume(new_vol)
                     self.current_volumes[channel_id] = new_vol
 
+    def tick_continuous(self, channel_id, target_volume):
+        """
+        set_continuous_volume() + update_volumes()를 한 번에 수행합니다.
+        햅틱 시스템 스텝마다 호출되는 경로용 (메서드 호출 및 조회 최소화).
+        
+        Parameters:
+        - channel_id: 목표 볼륨을 설정할 채널 ID (연속 재생 중이 아니면 무시)
+        - target_volume: 목표 볼륨 (0.0~1.0)
+        """
+        target_volumes = self.target_volumes
+        current_volumes = self.current_volumes
+        if channel_id in self.continuous_channels:
+            target_volumes[channel_id] = min(1.0, max(0.0, target_volume))
+        
+        smooth_factor = self.volume_smooth_factor
+        # 다른 스레드의 start/stop으로 dict가 바뀌어도 안전하도록 스냅샷 순회 (채널 수는 몇 개뿐)
+        for ch_id, state in list(self.continuous_channels.items()):
+            current_vol = current_volumes.get(ch_id)
+            target_vol = target_volumes.get(ch_id)
+            if current_vol is None or target_vol is None:
+                continue  # 순회 중 중지된 채널
+            
+            # 부드러운 볼륨 전환 + 매우 작은 차이는 목표값으로 스냅
+            new_vol = current_vol + (target_vol - current_vol) * smooth_factor
+            if abs(new_vol - target_vol) < 0.001:
+                new_vol = target_vol
+            
+            state['sound'].set_volume(new_vol)
+            current_volumes[ch_id] = new_vol
+
     def stop_continuous_sound(self, channel_id):
         """
         연속 재생 중인 사운드를 중지합니다.
@@ -3,9 +3,34 @@ Haptic Renderer for generating sound objects from parameters
 햅틱 렌더러 - 뉴런 스파이크 신호를 사운드 객체로 변환하는 모듈
 주파수, 지속시간, 진폭 파라미터를 받아서 pygame.mixer.Sound 객체를 생성
 '''
+import functools
 import numpy as np
 import pygame
 
+
+def _cached_sound(method):
+    """
+    같은 인자로 다시 요청하면 파형을 재계산하지 않고 같은 Sound 객체 반환
+    
+    캐시는 인스턴스의 일반 dict(self._sound_cache)에 두므로 인스턴스↔캐시 순환 참조가 없고,
+    렌더러가 버려지면 캐시된 Sound도 바로 해제됨
+    """
+    name = method.__name__
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (name, args, tuple(sorted(kwargs.items())))
+        cache = self._sound_cache
+        sound = cache.get(key)
+        if sound is None:
+            sound = method(self, *args, **kwargs)
+            if len(cache) >= HapticRenderer.SOUND_CACHE_SIZE:
+                del cache[next(iter(cache))]  # 가장 오래된 항목 제거
+            cache[key] = sound
+        return sound
+    return wrapper
+
+
 class HapticRenderer:
     """
     햅틱 피드백을 위한 사운드 렌더링 클래스
@@ -18,6 +43,8 @@ class HapticRenderer:
     뉴런 스파이크 → 파라미터 (hz, ms, amp) → HapticRenderer → pygame.mixer.Sound
     """
     
+    SOUND_CACHE_SIZE = 128  # 인스턴스별 Sound 캐시 최대 항목 수
+    
     def __init__(self, sample_rate=44100):
         """
         햅틱 렌더러 초기화
@@ -31,6 +58,14 @@ class HapticRenderer:
             print("Warning: Pygame mixer is not initialized. HapticRenderer might rely on a default sample rate.")
         else:
             pass 
+        
+        # 사운드 생성 결과 캐시 (같은 hz, ms, amp, fade_out_ms, 재질 파라미터 → 같은 Sound 객체)
+        # 인스턴스별이므로 렌더러/믹서를 재생성하면 캐시도 새로 시작
+        self._sound_cache = {}
+    
+    def clear_cache(self):
+        """캐시된 Sound 객체 해제 (믹서 종료 전 정리용)"""
+        self._sound_cache.clear()
 
     def create_sound_buffer(self, hz, ms, amp, fade_out_ms=10):
         """
@@ -63,6 +98,7 @@ class HapticRenderer:
         # 16비트 정수로 변환 (-32768 ~ 32767 범위)
         return (wave_data * 32767).astype(np.int16)
 
+    @_cached_sound
     def create_sound_object(self, hz, ms, amp, fade_out_ms=10):
         """
         pygame.mixer.Sound 객체를 생성
@@ -128,6 +164,7 @@ class HapticRenderer:
             return pygame.mixer.Sound(buffer=np.array([0], dtype=np.int16))
         return pygame.mixer.Sound(buffer=sound_buffer)
 
+    @_cached_sound
     def create_material_sound(self, material_type, hz, ms, amp, fade_out_ms=10, **kwargs):
         """
         재질별 특화 파형을 가진 사운드 객체를 생성
@@ -430,6 +467,7 @@ class HapticRenderer:
         
         return (np.clip(wave_data, -1, 1) * 32767).astype(np.int16)
 
+    @_cached_sound
     def create_sa_background_sound(self, hz, ms, amp, fade_out_ms=50):
         """
         SA 뉴런용 피에조 진동 사운드 생성
@@ -487,6 +525,7 @@ class HapticRenderer:
         
         return pygame.mixer.Sound(buffer=sound_buffer)
 
+    @_cached_sound
     def create_ra_click_sound(self, hz, ms, amp, fade_out_ms=5):
         """
         RA 클릭용 맥북 터치패드 스타일 깔끔한 클릭 사운드 생성
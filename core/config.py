@@ -17,6 +17,7 @@ def get_haptic_config():
         # === 시뮬레이션 기본 설정 ===
         'neuron_dt_ms': 1.0,        # 뉴런 시뮬레이션 시간 간격 (밀리초)
         'plot_hist_sz': 500,        # 그래프에 표시할 데이터 포인트 수
+        'verbose': False,           # 스파이크/볼륨 이벤트 로그 출력 (백그라운드 스레드)
         
         # === SA 뉴런 (압력 감지) 파라미터 ===
         'sa_neuron': {
@@ -10,11 +10,12 @@ Haptic GUI Window
 '''
 
 import sys
+import logging
 import numpy as np
 import time
 from collections import deque
 from PyQt6.QtWidgets import QMainWindow, QLabel, QVBoxLayout, QWidget
-from PyQt6.QtCore import QTimer, Qt, QPointF
+from PyQt6.QtCore import QTimer, Qt, QPointF, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QKeyEvent
 
 # Matplotlib 설정
@@ -28,7 +29,7 @@ matplotlib.rcParams.update({
     'xtick.labelsize': 9, 
     'ytick.labelsize': 9,
     'legend.fontsize': 10,
-    'figure.dpi': 100,
+    'figure.dpi': 72,
     'figure.facecolor': '#1c1c1e',
     'axes.facecolor': '#1c1c1e',
     'axes.edgecolor': '#a0a0a0',
@@ -39,13 +40,48 @@ matplotlib.rcParams.update({
     'grid.color': '#505050',
     'grid.linestyle': '--',
     'grid.alpha': 0.7,
-    'lines.linewidth': 1.8
+    'lines.linewidth': 1.8,
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000
 })
 
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from .haptic_system import HapticSystem
 
+
+class _HapticSystemRebuildSignals(QObject):
+    """백그라운드 재생성 완료 시그널 (QRunnable은 시그널을 가질 수 없으므로 분리)"""
+    finished = pyqtSignal(object, object)  # (새 HapticSystem 또는 None, 실패 시 예외 또는 None)
+
+
+class _HapticSystemRebuild(QRunnable):
+    """
+    기존 HapticSystem 정리 + 새 HapticSystem 생성을 스레드 풀에서 실행
+    
+    오디오 장치 재초기화와 사운드 생성이 GUI 스레드를 멈추지 않도록 분리.
+    완료되면 signals.finished로 새 시스템을 GUI 스레드에 전달.
+    정리/생성 중 예외가 나도 항상 (None, 예외)로 finished를 보내 GUI가 리셋 대기에 멈추지 않게 함.
+    """
+    
+    def __init__(self, old_system, config):
+        super().__init__()
+        self.old_system = old_system
+        self.config = config
+        self.signals = _HapticSystemRebuildSignals()
+    
+    def run(self):
+        try:
+            if self.old_system is not None:
+                self.old_system.cleanup()
+            haptic_system = HapticSystem(self.config)
+        except Exception as e:  # 믹서 재초기화 실패 시 사운드 생성의 pygame.error 등
+            self.signals.finished.emit(None, e)
+            return
+        self.signals.finished.emit(haptic_system, None)
+
+
 class HapticGUI(QMainWindow):
     """
     햅틱 피드백 시뮬레이션 GUI 윈도우
@@ -63,12 +99,26 @@ class HapticGUI(QMainWindow):
         self.config = config
         ui_cfg = config['ui']
         
+        # 매 틱/이벤트마다 읽는 설정값 캐시 (dict 조회 제거)
+        self._m_stop_thresh = config['mouse']['m_stop_thresh']
+        self._max_spd_clamp = config['mouse']['max_spd_clamp']
+        self._plot_hist_sz = config['plot_hist_sz']
+        self._last_idx = self._plot_hist_sz - 1
+        self._neuron_dt_ms_int = int(config['neuron_dt_ms'])
+        
+        # 볼륨 3종 [SA, RA Motion 최대, RA Click] (+/- 키로 일괄 조절)
+        snd_cfg = config['sound']
+        self._volumes = np.array([snd_cfg['sa_sound_volume'], snd_cfg['ra_motion_max_vol_scl'],
+                                  snd_cfg['ra_click_volume']], dtype=np.float64)
+        
         # 윈도우 설정
         self.setWindowTitle("Haptic Ring Monitoring - Neural Feedback System")
         self.setGeometry(50, 50, ui_cfg['window_width'], ui_cfg['window_height'])
         
         # === 햅틱 시스템 초기화 ===
         self.haptic_system = HapticSystem(config)
+        self._rebuild_signals = None
+        self._closing = False
         
         # === UI 구성 ===
         self._setup_ui()
@@ -90,15 +140,24 @@ class HapticGUI(QMainWindow):
         # === 그래프 업데이트 관련 ===
         self.plot_update_counter = 0
         self.plot_update_interval = config['plot']['update_interval']
-        self.sa_spike_indices = deque(maxlen=config['plot_hist_sz'])
-        self.ra_motion_spike_indices = deque(maxlen=config['plot_hist_sz'])
-        self.ra_click_spike_indices = deque(maxlen=config['plot_hist_sz'])
+        # 스파이크 인덱스: 미리 할당된 int32 배열 + 유효 개수 (벡터화 이동용)
+        self.sa_spike_indices = np.empty(self._plot_hist_sz, dtype=np.int32)
+        self.sa_spike_n = 0
+        self.ra_motion_spike_indices = np.empty(self._plot_hist_sz, dtype=np.int32)
+        self.ra_motion_spike_n = 0
+        self.ra_click_spike_indices = np.empty(self._plot_hist_sz, dtype=np.int32)
+        self.ra_click_spike_n = 0
         self.drawn_spike_lines = []
         
+        self._update_plots = self._make_plot_updater()
+        
+        # === 키보드 디스패치 테이블 ===
+        self._build_key_table()
+        
         # === 타이머 시작 ===
         self.timer = QTimer(self)
         self.timer.timeout.connect(self._update_simulation)
-        self.timer.start(int(config['neuron_dt_ms']))
+        self.timer.start(self._neuron_dt_ms_int)
         
         print("🖥️ GUI initialized successfully!")
     
@@ -130,39 +189,43 @@ class HapticGUI(QMainWindow):
         self.main_layout = layout
     
     def _init_plot_data(self):
-        """그래프 데이터 히스토리 초기화"""
-        plot_hist_sz = self.config['plot_hist_sz']
+        """
+        그래프 데이터 히스토리 초기화 (6개 트레이스를 하나의 float32 링 버퍼 블록으로)
         
-        # SA 뉴런 히스토리
-        sa_v_init = self.config['sa_neuron']['v_init']
-        self.sa_v_hist = deque([sa_v_init] * plot_hist_sz, maxlen=plot_hist_sz)
-        self.sa_u_hist = deque([0.0] * plot_hist_sz, maxlen=plot_hist_sz)
+        hist의 각 행(SA v/u, RA Motion v/u, RA Click v/u)은 hist_pos를 쓰기 위치로 하는
+        링 버퍼라 열 순서가 시간 순서가 아님. 시간 순서 데이터는 ordered_hist()로 얻음.
+        """
+        plot_hist_sz = self._plot_hist_sz
         
-        # RA Motion 뉴런 히스토리
-        ra_motion_v_init = self.config['ra_neuron']['v_init']
-        self.ra_motion_v_hist = deque([ra_motion_v_init] * plot_hist_sz, maxlen=plot_hist_sz)
-        self.ra_motion_u_hist = deque([0.0] * plot_hist_sz, maxlen=plot_hist_sz)
+        self.hist = np.zeros((6, plot_hist_sz), dtype=np.float32)
+        self.hist_pos = 0  # 다음에 기록할 열 (가장 오래된 샘플 위치)
         
-        # RA Click 뉴런 히스토리
-        ra_click_v_init = self.config['ra_click_neuron']['v_init']
-        self.ra_click_v_hist = deque([ra_click_v_init] * plot_hist_sz, maxlen=plot_hist_sz)
-        self.ra_click_u_hist = deque([0.0] * plot_hist_sz, maxlen=plot_hist_sz)
+        # v 행은 초기 막전위로 (u 행은 0)
+        self.hist[0] = self.config['sa_neuron']['v_init']
+        self.hist[2] = self.config['ra_neuron']['v_init']
+        self.hist[4] = self.config['ra_click_neuron']['v_init']
         
         self.x_data = np.arange(plot_hist_sz)
     
+    def ordered_hist(self):
+        """hist 링 버퍼를 시간 순서(오래된 것 → 최신)로 정렬한 (6, N) 복사본 반환"""
+        return np.roll(self.hist, -self.hist_pos, axis=1)
+    
     def _setup_plots(self):
         """3개 뉴런 그래프 설정"""
         ui_cfg = self.config['ui']
-        plot_hist_sz = self.config['plot_hist_sz']
+        plot_hist_sz = self._plot_hist_sz
+        
+        sa_v, sa_u, ra_motion_v, ra_motion_u, ra_click_v, ra_click_u = self.ordered_hist()
         
         # 그래프 생성
         self.figure = Figure(figsize=(7, 8))
         self.ax_sa, self.ax_ra_motion, self.ax_ra_click = self.figure.subplots(3, 1)
         
         # SA 뉴런 그래프
-        self.sa_v_line, = self.ax_sa.plot(self.x_data, list(self.sa_v_hist), 
+        self.sa_v_line, = self.ax_sa.plot(self.x_data, sa_v, 
                                          lw=1.8, label='SA_v', color=ui_cfg['sa_line_color'])
-        self.sa_u_line, = self.ax_sa.plot(self.x_data, list(self.sa_u_hist), 
+        self.sa_u_line, = self.ax_sa.plot(self.x_data, sa_u, 
                                          lw=1.8, label='SA_u', color=ui_cfg['ra_line_color'])
         self.ax_sa.set_title('SA Neuron (Pressure)')
         self.ax_sa.set_ylabel('V (mV), U', fontsize=11)
@@ -174,9 +237,9 @@ class HapticGUI(QMainWindow):
         self.ax_sa.spines['right'].set_visible(False)
         
         # RA Motion 뉴런 그래프
-        self.ra_motion_v_line, = self.ax_ra_motion.plot(self.x_data, list(self.ra_motion_v_hist), 
+        self.ra_motion_v_line, = self.ax_ra_motion.plot(self.x_data, ra_motion_v, 
                                                        lw=1.8, label='RA_Motion_v', color=ui_cfg['sa_line_color'])
-        self.ra_motion_u_line, = self.ax_ra_motion.plot(self.x_data, list(self.ra_motion_u_hist), 
+        self.ra_motion_u_line, = self.ax_ra_motion.plot(self.x_data, ra_motion_u, 
                                                        lw=1.8, label='RA_Motion_u', color=ui_cfg['ra_line_color'])
         self.ax_ra_motion.set_title('RA Motion Neuron (Movement)')
         self.ax_ra_motion.set_ylabel('V (mV), U', fontsize=11)
@@ -188,9 +251,9 @@ class HapticGUI(QMainWindow):
         self.ax_ra_motion.spines['right'].set_visible(False)
         
         # RA Click 뉴런 그래프
-        self.ra_click_v_line, = self.ax_ra_click.plot(self.x_data, list(self.ra_click_v_hist), 
+        self.ra_click_v_line, = self.ax_ra_click.plot(self.x_data, ra_click_v, 
                                                      lw=1.8, label='RA_Click_v', color=ui_cfg['sa_line_color'])
-        self.ra_click_u_line, = self.ax_ra_click.plot(self.x_data, list(self.ra_click_u_hist), 
+        self.ra_click_u_line, = self.ax_ra_click.plot(self.x_data, ra_click_u, 
                                                      lw=1.8, label='RA_Click_u', color=ui_cfg['ra_line_color'])
         self.ax_ra_click.set_title('RA Click Neuron (Click On/Off)')
         self.ax_ra_click.set_ylabel('V (mV), U', fontsize=11)
@@ -202,6 +265,11 @@ class HapticGUI(QMainWindow):
         self.ax_ra_click.spines['top'].set_visible(False)
         self.ax_ra_click.spines['right'].set_visible(False)
         
+        # 트레이스 라인은 안티앨리어싱 없이 래스터화 (매 갱신 비용 감소, 그리드/축은 유지)
+        for line in (self.sa_v_line, self.sa_u_line, self.ra_motion_v_line,
+                     self.ra_motion_u_line, self.ra_click_v_line, self.ra_click_u_line):
+            line.set_antialiased(False)
+        
         # 시간축 설정
         tick_locs = np.linspace(0, plot_hist_sz - 1, 6)
         tick_labels = np.linspace(2500, 0, 6).astype(int)
@@ -216,33 +284,34 @@ class HapticGUI(QMainWindow):
     
     def _update_simulation(self):
         """시뮬레이션 한 스텝 실행"""
+        # 리셋 중 (햅틱 시스템 재생성 대기)
+        if self.haptic_system is None:
+            return
+        
         # 마우스 정지 감지
-        if (time.perf_counter() - self.last_mouse_time) > self.config['mouse']['m_stop_thresh'] and self.mouse_pressed:
+        if (time.perf_counter() - self.last_mouse_time) > self._m_stop_thresh and self.mouse_pressed:
             self.mouse_speed = 0.0
             self._update_status_label()
         
         # 햅틱 시스템 스텝 실행
         sa_fired, ra_motion_fired, ra_click_fired, sa_vu, ra_motion_vu, ra_click_vu = self.haptic_system.step(
-            mouse_speed=self.mouse_speed,
-            avg_mouse_speed=self.avg_mouse_speed
+            self.mouse_speed, self.avg_mouse_speed
         )
         
         # 뉴런 상태 히스토리 업데이트
-        self.sa_v_hist.append(sa_vu[0])
-        self.sa_u_hist.append(sa_vu[1])
-        self.ra_motion_v_hist.append(ra_motion_vu[0])
-        self.ra_motion_u_hist.append(ra_motion_vu[1])
-        self.ra_click_v_hist.append(ra_click_vu[0])
-        self.ra_click_u_hist.append(ra_click_vu[1])
+        pos = self.hist_pos
+        self.hist[:, pos] = (sa_vu[0], sa_vu[1], ra_motion_vu[0], ra_motion_vu[1], ra_click_vu[0], ra_click_vu[1])
+        pos += 1
+        self.hist_pos = 0 if pos == self._plot_hist_sz else pos
         
         # 스파이크 인덱스 기록
-        plot_hist_sz = self.config['plot_hist_sz']
+        last_idx = self._last_idx
         if sa_fired:
-            self.sa_spike_indices.append(plot_hist_sz - 1)
+            self.sa_spike_n = self._push_spike_index(self.sa_spike_indices, self.sa_spike_n, last_idx)
         if ra_motion_fired:
-            self.ra_motion_spike_indices.append(plot_hist_sz - 1)
+            self.ra_motion_spike_n = self._push_spike_index(self.ra_motion_spike_indices, self.ra_motion_spike_n, last_idx)
         if ra_click_fired:
-            self.ra_click_spike_indices.append(plot_hist_sz - 1)
+            self.ra_click_spike_n = self._push_spike_index(self.ra_click_spike_indices, self.ra_click_spike_n, last_idx)
         
         # 주기적으로 그래프 업데이트
         self.plot_update_counter += 1
@@ -250,78 +319,82 @@ class HapticGUI(QMainWindow):
             self._update_plots()
             self.plot_update_counter = 0
     
-    def _update_plots(self):
-        """그래프 업데이트"""
-        # 기존 스파이크 라인 제거
-        for line in self.drawn_spike_lines:
-            line.remove()
-        self.drawn_spike_lines.clear()
-        
-        # 그래프 데이터 업데이트
-        self.sa_v_line.set_ydata(self.sa_v_hist)
-        self.sa_u_line.set_ydata(self.sa_u_hist)
-        self.ra_motion_v_line.set_ydata(self.ra_motion_v_hist)
-        self.ra_motion_u_line.set_ydata(self.ra_motion_u_hist)
-        self.ra_click_v_line.set_ydata(self.ra_click_v_hist)
-        self.ra_click_u_line.set_ydata(self.ra_click_u_hist)
-        
-        # 스파이크 라인 그리기
+    def _make_plot_updater(self):
+        """
+        그래프 업데이트 함수 생성
+        
+        매 갱신마다 쓰는 라인/축/버퍼를 클로저 지역변수로 묶어 속성 조회(LOAD_ATTR)를 제거.
+        hist 블록이 재할당되면 (_reset_simulation) 다시 생성해야 함.
+        """
+        hist = self.hist
+        lines = (self.sa_v_line, self.sa_u_line, self.ra_motion_v_line,
+                 self.ra_motion_u_line, self.ra_click_v_line, self.ra_click_u_line)
+        sa_ax, ra_motion_ax, ra_click_ax = self.ax_sa, self.ax_ra_motion, self.ax_ra_click
+        sa_indices = self.sa_spike_indices
+        ra_motion_indices = self.ra_motion_spike_indices
+        ra_click_indices = self.ra_click_spike_indices
+        drawn = self.drawn_spike_lines
         spike_color = self.config['ui']['spike_line_color']
+        shift_spike_indices = self._shift_spike_indices
+        draw_idle = self.plot_canvas.draw_idle
+        roll = np.roll
+        gui = self
+        
+        def update_plots():
+            """그래프 업데이트"""
+            # 기존 스파이크 라인 제거
+            for line in drawn:
+                line.remove()
+            drawn.clear()
+            
+            # 그래프 데이터 업데이트 (링 버퍼를 시간 순서로 한 번에 정렬)
+            ordered = roll(hist, -gui.hist_pos, axis=1)
+            for line, row in zip(lines, ordered):
+                line.set_ydata(row)
+            
+            # 스파이크 라인 그리기 (SA 20개, RA Motion 30개, RA Click 15개까지)
+            for ax, indices, n, limit in ((sa_ax, sa_indices, gui.sa_spike_n, 20),
+                                          (ra_motion_ax, ra_motion_indices, gui.ra_motion_spike_n, 30),
+                                          (ra_click_ax, ra_click_indices, gui.ra_click_spike_n, 15)):
+                for x_idx in indices[max(0, n - limit):n]:
+                    drawn.append(ax.axvline(x_idx, color=spike_color, ls='--', lw=1.2))
+            
+            # 스파이크 인덱스 이동 (시간 흐름)
+            shift_spike_indices()
+            
+            # 그래프 다시 그리기
+            draw_idle()
         
-        # SA 스파이크 라인
-        visible_sa_spikes = list(self.sa_spike_indices)[-20:] if len(self.sa_spike_indices) > 20 else self.sa_spike_indices
-        for x_idx in visible_sa_spikes:
-            if x_idx >= 0:
-                self.drawn_spike_lines.append(self.ax_sa.axvline(x_idx, color=spike_color, ls='--', lw=1.2))
-        
-        # RA Motion 스파이크 라인
-        visible_ra_motion_spikes = list(self.ra_motion_spike_indices)[-30:] if len(self.ra_motion_spike_indices) > 30 else self.ra_motion_spike_indices
-        for x_idx in visible_ra_motion_spikes:
-            if x_idx >= 0:
-                self.drawn_spike_lines.append(self.ax_ra_motion.axvline(x_idx, color=spike_color, ls='--', lw=1.2))
-        
-        # RA Click 스파이크 라인
-        visible_ra_click_spikes = list(self.ra_click_spike_indices)[-15:] if len(self.ra_click_spike_indices) > 15 else self.ra_click_spike_indices
-        for x_idx in visible_ra_click_spikes:
-            if x_idx >= 0:
-                self.drawn_spike_lines.append(self.ax_ra_click.axvline(x_idx, color=spike_color, ls='--', lw=1.2))
-        
-        # 스파이크 인덱스 이동 (시간 흐름)
-        self._shift_spike_indices()
-        
-        # 그래프 다시 그리기
-        self.plot_canvas.draw_idle()
+        return update_plots
+    
+    def _push_spike_index(self, indices, n, idx):
+        """스파이크 인덱스 추가 (가득 차면 가장 오래된 값을 밀어냄), 새 개수 반환"""
+        if n == indices.shape[0]:
+            indices[:-1] = indices[1:]
+            n -= 1
+        indices[n] = idx
+        return n + 1
+    
+    def _shift_indices(self, indices, n, interval):
+        """인덱스 배열을 interval만큼 이동하고 음수가 된 값은 제거, 새 개수 반환"""
+        active = indices[:n]
+        active -= interval
+        kept = active[active >= 0]
+        n = kept.shape[0]
+        indices[:n] = kept
+        return n
     
     def _shift_spike_indices(self):
-        """스파이크 인덱스를 시간 흐름에 따라 이동"""
+        """스파이크 인덱스를 시간 흐름에 따라 이동 (NumPy 벡터 연산)"""
         interval = self.plot_update_interval
-        
-        # SA 스파이크 인덱스 이동
-        new_sa_indices = deque(maxlen=self.sa_spike_indices.maxlen)
-        for x_idx in self.sa_spike_indices:
-            shifted_idx = x_idx - interval
-            if shifted_idx >= 0:
-                new_sa_indices.append(shifted_idx)
-        self.sa_spike_indices = new_sa_indices
-        
-        # RA Motion 스파이크 인덱스 이동
-        new_ra_motion_indices = deque(maxlen=self.ra_motion_spike_indices.maxlen)
-        for x_idx in self.ra_motion_spike_indices:
-            shifted_idx = x_idx - interval
-            if shifted_idx >= 0:
-                new_ra_motion_indices.append(shifted_idx)
-        self.ra_motion_spike_indices = new_ra_motion_indices
-        
-        # RA Click 스파이크 인덱스 이동
-        new_ra_click_indices = deque(maxlen=self.ra_click_spike_indices.maxlen)
-        for x_idx in self.ra_click_spike_indices:
-            shifted_idx = x_idx - interval
-            if shifted_idx >= 0:
-                new_ra_click_indices.append(shifted_idx)
-        self.ra_click_spike_indices = new_ra_click_indices
+        self.sa_spike_n = self._shift_indices(self.sa_spike_indices, self.sa_spike_n, interval)
+        self.ra_motion_spike_n = self._shift_indices(self.ra_motion_spike_indices, self.ra_motion_spike_n, interval)
+        self.ra_click_spike_n = self._shift_indices(self.ra_click_spike_indices, self.ra_click_spike_n, interval)
     
     def _update_status_label(self):
         """상태 라벨 업데이트"""
+        if self.haptic_system is None:
+            return
         material = self.haptic_system.current_material_key
         roughness = self.haptic_system.current_roughness
         spike_rate = self.haptic_system.current_spike_rate
@@ -335,7 +408,8 @@ class HapticGUI(QMainWindow):
     def mousePressEvent(self, event):
         """마우스 클릭 이벤트"""
         self.mouse_pressed = True
-        self.haptic_system.mouse_press()
+        if self.haptic_system is not None:
+            self.haptic_system.mouse_press()
         
         pos = event.position() if hasattr(event, 'position') else QPointF(event.x(), event.y())
         self.last_mouse_pos = pos
@@ -348,7 +422,8 @@ class HapticGUI(QMainWindow):
     def mouseReleaseEvent(self, event):
         """마우스 릴리즈 이벤트"""
         self.mouse_pressed = False
-        self.haptic_system.mouse_release()
+        if self.haptic_system is not None:
+            self.haptic_system.mouse_release()
         self.mouse_speed = 0.0
         self._update_status_label()
     
@@ -362,7 +437,7 @@ class HapticGUI(QMainWindow):
             if dt > 0.0001:  # 최소 시간 간격
                 distance = np.sqrt((current_pos.x() - self.last_mouse_pos.x())**2 + 
                                  (current_pos.y() - self.last_mouse_pos.y())**2)
-                self.mouse_speed = min(distance / dt, self.config['mouse']['max_spd_clamp'])
+                self.mouse_speed = min(distance / dt, self._max_spd_clamp)
                 self.speed_history.append(self.mouse_speed)
                 self.avg_mouse_speed = np.mean(self.speed_history) if self.speed_history else 0.0
                 
@@ -370,50 +445,64 @@ class HapticGUI(QMainWindow):
                 self.last_mouse_time = current_time
                 self._update_status_label()
     
+    def _build_key_table(self):
+        """키 코드 → 핸들러 디스패치 테이블 생성 (enum 속성 조회를 초기화 시 1회로)"""
+        self._key_table = {
+            Qt.Key.Key_Space.value: self._toggle_pause,
+            Qt.Key.Key_R.value: self._reset_simulation,
+            Qt.Key.Key_Plus.value: lambda: self._adjust_volume(0.1),
+            Qt.Key.Key_Equal.value: lambda: self._adjust_volume(0.1),
+            Qt.Key.Key_Minus.value: lambda: self._adjust_volume(-0.1),
+            Qt.Key.Key_Escape.value: self.close,
+        }
+        self._key_material_first = Qt.Key.Key_1.value
+        self._key_material_last = Qt.Key.Key_7.value
+    
     def keyPressEvent(self, event: QKeyEvent):
         """키보드 이벤트 처리"""
         key = event.key()
         
         # 재질 변경 (1-7 키)
-        if Qt.Key.Key_1 <= key <= Qt.Key.Key_7:
-            material_index = key - Qt.Key.Key_1
+        if self._key_material_first <= key <= self._key_material_last:
+            if self.haptic_system is None:
+                return
+            material_index = key - self._key_material_first
             if self.haptic_system.change_material(material_index):
                 self._update_status_label()
+            return
         
-        # 일시정지/재개 (스페이스바)
-        elif key == Qt.Key.Key_Space:
-            if self.timer.isActive():
-                self.timer.stop()
-                self.info_label.setText("PAUSED - Press SPACE to resume")
-            else:
-                self.timer.start(int(self.config['neuron_dt_ms']))
-                self.info_label.setText("Click/SA+RA_Click, Move/RA_Motion (1-7 Materials)")
-        
-        # 시뮬레이션 리셋 (R 키)
-        elif key == Qt.Key.Key_R:
-            self._reset_simulation()
-        
-        # 볼륨 조절 (+/- 키)
-        elif key == Qt.Key.Key_Plus or key == Qt.Key.Key_Equal:
-            self._adjust_volume(0.1)
-        elif key == Qt.Key.Key_Minus:
-            self._adjust_volume(-0.1)
-        
-        # 종료 (ESC 키)
-        elif key == Qt.Key.Key_Escape:
-            self.close()
-        
+        # 일시정지(SPACE), 리셋(R), 볼륨(+/-), 종료(ESC)
+        handler = self._key_table.get(key)
+        if handler is not None:
+            handler()
         else:
             super().keyPressEvent(event)
     
+    def _toggle_pause(self):
+        """일시정지/재개"""
+        if self.timer.isActive():
+            self.timer.stop()
+            self.info_label.setText("PAUSED - Press SPACE to resume")
+        else:
+            self.timer.start(self._neuron_dt_ms_int)
+            self.info_label.setText("Click/SA+RA_Click, Move/RA_Motion (1-7 Materials)")
+    
     def _reset_simulation(self):
-        """시뮬레이션 리셋"""
-        # 햅틱 시스템 재생성
-        self.haptic_system.cleanup()
-        self.haptic_system = HapticSystem(self.config)
-        
-        # 그래프 데이터 초기화
+        """시뮬레이션 리셋 (햅틱 시스템 재생성은 백그라운드 스레드에서)"""
+        if self._rebuild_signals is not None:
+            return  # 이미 리셋 진행 중 (이전 재생성이 실패해 haptic_system이 None이면 다시 시도)
+        
+        # 햅틱 시스템 재생성 (완료 시 _on_haptic_system_rebuilt에서 교체)
+        rebuild = _HapticSystemRebuild(self.haptic_system, self.config)
+        rebuild.signals.finished.connect(self._on_haptic_system_rebuilt)
+        self._rebuild_signals = rebuild.signals  # 완료 전 GC 방지
+        self.haptic_system = None
+        self.info_label.setText("RESETTING...")
+        QThreadPool.globalInstance().start(rebuild)
+        
+        # 그래프 데이터 초기화 (새 hist 블록에 맞춰 업데이트 함수 재생성)
         self._init_plot_data()
+        self._update_plots = self._make_plot_updater()
         
         # 마우스 상태 초기화
         self.mouse_pressed = False
@@ -422,27 +511,52 @@ class HapticGUI(QMainWindow):
         self.avg_mouse_speed = 0.0
         
         # 스파이크 인덱스 초기화
-        self.sa_spike_indices.clear()
-        self.ra_motion_spike_indices.clear()
-        self.ra_click_spike_indices.clear()
-        
+        self.sa_spike_n = 0
+        self.ra_motion_spike_n = 0
+        self.ra_click_spike_n = 0
+    
+    def _on_haptic_system_rebuilt(self, haptic_system, error):
+        """백그라운드에서 생성된 햅틱 시스템으로 교체 (GUI 스레드)"""
+        self._rebuild_signals = None
+        if error is not None:
+            # 햅틱 시스템 없이 대기 (입력은 무시), R 키로 재시도 가능
+            logging.error("Failed to rebuild haptic system", exc_info=error)
+            if not self._closing:
+                self.info_label.setText(f"RESET FAILED: {error} - Press R to retry")
+            return
+        if self._closing:
+            haptic_system.cleanup()
+            return
+        
+        self.haptic_system = haptic_system
+        # 재생성 중 +/- 로 바뀐 볼륨을 반영 (생성 시점 config 기준으로 캐시되어 있음)
+        haptic_system.refresh_volume_settings()
+        if self.timer.isActive():
+            self.info_label.setText("Click/SA+RA_Click, Move/RA_Motion (1-7 Materials)")
+        else:
+            self.info_label.setText("PAUSED - Press SPACE to resume")
         self._update_status_label()
         print("🔄 Simulation reset!")
     
     def _adjust_volume(self, delta):
-        """볼륨 조절"""
-        sound_cfg = self.config['sound']
+        """볼륨 조절 (SA, RA Motion 최대, RA Click 볼륨을 한 번에 클램핑)"""
+        volumes = self._volumes
+        np.clip(volumes + delta, 0.0, 1.0, out=volumes)
         
-        # 모든 사운드 볼륨 동시 조절
-        sound_cfg['sa_sound_volume'] = max(0.0, min(1.0, sound_cfg['sa_sound_volume'] + delta))
-        sound_cfg['ra_motion_max_vol_scl'] = max(0.0, min(1.0, sound_cfg['ra_motion_max_vol_scl'] + delta))
-        sound_cfg['ra_click_volume'] = max(0.0, min(1.0, sound_cfg['ra_click_volume'] + delta))
-        
-        vol = sound_cfg['sa_sound_volume']
-        print(f"🔊 Volume adjusted: SA={vol:.1f}, RA_Motion={sound_cfg['ra_motion_max_vol_scl']:.1f}, RA_Click={sound_cfg['ra_click_volume']:.1f}")
+        sound_cfg = self.config['sound']
+        sa_vol, ra_motion_vol, ra_click_vol = volumes.tolist()
+        sound_cfg['sa_sound_volume'] = sa_vol
+        sound_cfg['ra_motion_max_vol_scl'] = ra_motion_vol
+        sound_cfg['ra_click_volume'] = ra_click_vol
+        if self.haptic_system is not None:
+            self.haptic_system.refresh_volume_settings()
+        
+        print(f"🔊 Volume adjusted: SA={sa_vol:.1f}, RA_Motion={ra_motion_vol:.1f}, RA_Click={ra_click_vol:.1f}")
         self._update_status_label()
     
     def closeEvent(self, event):
         """윈도우 종료 이벤트"""
-        self.haptic_system.cleanup()
+        self._closing = True
+        if self.haptic_system is not None:
+            self.haptic_system.cleanup()
         super().closeEvent(event) 
\ No newline at end of file
@@ -10,11 +10,64 @@ Haptic System Coordinator
 '''
 
 import time
+import threading
 import numpy as np
 from collections import deque
 from neuron.spike_encoder import SpikeEncoder
 from audio.haptic_renderer import HapticRenderer
 from audio.audio_player import AudioPlayer
+from utils.jit import njit
+
+
+@njit(cache=True, fastmath=True)
+def _spike_rate_to_volume(spike_rate, min_rate, max_rate, min_volume, max_volume):
+    """스파이크 발생률을 볼륨으로 변환 (min_rate~max_rate 구간 선형, 양 끝은 포화)"""
+    if spike_rate <= 0.0:
+        return 0.0
+    ratio = max(0.0, min(1.0, (spike_rate - min_rate) / (max_rate - min_rate)))
+    return min_volume + (max_volume - min_volume) * ratio
+
+
+@njit(cache=True, fastmath=True)
+def _compute_volume(spike_rate, current_volume, mouse_pressed, min_rate, max_rate,
+                    min_volume, max_volume, smooth_factors):
+    """
+    RA Motion 목표 볼륨 계산 + 스무딩 (스칼라 전용, numba 컴파일 대상)
+    
+    Parameters:
+    - smooth_factors: [감소 시 계수, 증가 시 계수] (target > current 로 인덱싱)
+    
+    Returns:
+    - tuple: (target_volume, new_current_volume)
+    """
+    # 목표 볼륨 계산
+    if mouse_pressed and spike_rate > 0.0:
+        target_volume = _spike_rate_to_volume(spike_rate, min_rate, max_rate, min_volume, max_volume)
+    else:
+        target_volume = 0.0
+    
+    # 볼륨 스무딩 (증가 시 부드럽게, 감소 시 빠르게) - 분기 대신 계수 테이블 조회
+    current_volume += (target_volume - current_volume) * smooth_factors[int(target_volume > current_volume)]
+    
+    # 작은 차이는 목표값으로 스냅
+    if abs(current_volume - target_volume) < 0.005:
+        current_volume = target_volume
+    
+    return target_volume, current_volume
+
+
+@njit(cache=True, fastmath=True)
+def _smooth_volumes(targets, current_volume, smooth_factors):
+    """목표 볼륨 배열에 _compute_volume과 같은 비대칭 1차 IIR 스무딩 + 스냅 적용"""
+    volumes = np.empty(targets.shape[0])
+    for i in range(targets.shape[0]):
+        target_volume = targets[i]
+        current_volume += (target_volume - current_volume) * smooth_factors[int(target_volume > current_volume)]
+        if abs(current_volume - target_volume) < 0.005:
+            current_volume = target_volume
+        volumes[i] = current_volume
+    return volumes
+
 
 class HapticSystem:
     """
@@ -28,10 +81,21 @@ class HapticSystem:
     5. 연속 사운드 볼륨 제어
     """
     
+    # 스파이크 스텝 링 버퍼 크기 (2의 거듭제곱, 25ms 윈도우 @ 1kHz 스텝 대비 충분)
+    _SPIKE_BUF_SIZE = 256
+    _SPIKE_BUF_MASK = _SPIKE_BUF_SIZE - 1
+    
     def __init__(self, config):
         """햅틱 시스템 초기화"""
         self.config = config
         
+        # === 지연 로깅 (실시간 스텝 경로에서 print 제거) ===
+        self._verbose = config.get('verbose', False)
+        self._log_buf = deque(maxlen=1024)
+        self._log_stop = threading.Event()
+        if self._verbose:
+            threading.Thread(target=self._drain_log, daemon=True).start()
+        
         # === 핵심 컴포넌트 초기화 ===
         self.audio_player = AudioPlayer()
         self.haptic_renderer = HapticRenderer()
@@ -42,40 +106,54 @@ class HapticSystem:
             neuron_dt_ms=config['neuron_dt_ms'],
             input_config=config['input_current']
         )
+        # 매 스텝 호출되는 메서드는 미리 바인딩 (속성 조회 1회로)
+        self._encode = self.spike_encoder.step
+        self._play_sound = self.audio_player.play_sound
+        self._tick_continuous = self.audio_player.tick_continuous
         
         # === 재질 관리 ===
         self.materials = config['materials']
+        assert self.materials, "At least one material must be configured"
         self.material_keys = list(self.materials.keys())
-        self.current_material_key = self.material_keys[0]  # 기본: Glass
+        self._current_idx = 0  # 기본: Glass
+        self.current_material_key = self.material_keys[0]
         self.current_roughness = self.materials[self.current_material_key]['r']
         
-        # === 사운드 캐시 ===
-        self.sound_cache = {}
+        # === 사운드 생성 (재질별 테이블) ===
         self._init_all_sounds()
         
         # === 연속 사운드 볼륨 제어 ===
         self.spike_window_duration_sec = 0.025  # 25ms 윈도우
-        self.ra_motion_spike_timestamps = deque()
+        # 시뮬레이션은 고정 neuron_dt_ms로 진행 → 시간 대신 스텝 카운터 사용
+        self._step_i = 0
+        self._dt_sec = config['neuron_dt_ms'] / 1000.0
+        self._window_steps = int(self.spike_window_duration_sec * 1000.0 / config['neuron_dt_ms'])
+        # RA Motion 스파이크 발생 스텝 링 버퍼 (스파이크가 난 스텝만 기록)
+        self._spike_steps = np.empty(self._SPIKE_BUF_SIZE, dtype=np.int64)
+        self._spike_head = 0  # 윈도우 내 가장 오래된 스파이크 (누적 인덱스)
+        self._spike_tail = 0  # 다음 기록 위치 (누적 인덱스)
         self.current_spike_rate = 0.0
         self.target_volume = 0.0
         self.current_volume = 0.0
+        self.last_logged_volume = 0.0
         self.volume_smooth_factor = 0.4
         self.volume_fast_decay_factor = 0.8
-        self.spike_rate_update_interval = 2
-        self.spike_rate_update_counter = 0
+        self._min_spike_rate = 20.0
+        self._max_spike_rate = 120.0
+        self._click_mag = config['input_current']['click_mag']
+        self.refresh_volume_settings()
         
         # === 마우스 상태 ===
         self.mouse_pressed = False
         self.last_mouse_time = time.perf_counter()
         
-        # 연속 사운드 시작
-        if hasattr(self, 'ra_motion_loop_sound'):
-            self.audio_player.start_continuous_sound(
-                self.ra_motion_loop_sound, channel_id=1, initial_volume=0.0
-            )
+        # 연속 사운드 시작 (채널 1 재생 여부는 _continuous_on으로 추적)
+        self._continuous_on = self.audio_player.start_continuous_sound(
+            self.ra_motion_loop_sound, channel_id=1, initial_volume=0.0
+        )
     
     def _init_all_sounds(self):
-        """모든 재질의 사운드들을 미리 생성하여 캐시"""
+        """SA 사운드와 재질별 주파수 테이블 준비 (재질 사운드는 지연 생성)"""
         snd_cfg = self.config['sound']
         
         # SA 뉴런 사운드 (진동감 있는 배경음으로 변경)
@@ -83,91 +161,117 @@ class HapticSystem:
             snd_cfg['sa_hz'], snd_cfg['sa_ms'], snd_cfg['sa_amp'], fade_out_ms=20
         )
         
-        # 각 재질별로 RA Motion, RA Click, Loop 사운드 생성
-        for mat_key, mat_props in self.materials.items():
-            self._create_material_sounds(mat_key, mat_props, snd_cfg)
-        
-        # 현재 재질의 사운드들 설정
-        self._update_current_material_sounds()
+        # 재질별 주파수 (로드 시 한 번만 계산, material_keys 순서)
+        self._ra_motion_hz = np.array([int(snd_cfg['ra_motion_base_hz'] * m['f']) for m in self.materials.values()],
+                                      dtype=np.int32)
+        self._ra_click_hz = np.array([int(snd_cfg['ra_click_hz'] * m['f']) for m in self.materials.values()],
+                                     dtype=np.int32)
+        
+        # 재질별 RA Motion, RA Click, Loop 사운드 슬롯 (처음 선택될 때 생성)
+        n_materials = len(self.material_keys)
+        self._mat_motion_sound = [None] * n_materials
+        self._mat_click_sound = [None] * n_materials
+        self._mat_loop_sound = [None] * n_materials
+        self._mat_built = [False] * n_materials
+        
+        # 재질 인덱스로 바로 접근하는 SoA 테이블 (material_keys 순서)
+        self._mat_roughness = np.array([m['r'] for m in self.materials.values()])
+        
+        # 현재 재질의 사운드들만 생성 후 설정
+        idx = self._current_idx
+        self._ensure_material_sounds(idx)
+        self.ra_motion_sound = self._mat_motion_sound[idx]
+        self.ra_click_sound = self._mat_click_sound[idx]
+        self.ra_motion_loop_sound = self._mat_loop_sound[idx]
     
-    def _create_material_sounds(self, mat_key, mat_props, snd_cfg):
-        """특정 재질의 모든 사운드 생성"""
+    def _ensure_material_sounds(self, idx):
+        """재질 사운드가 아직 없으면 생성 (재질당 최초 1회)"""
+        if self._mat_built[idx]:
+            return
+        mat_key = self.material_keys[idx]
+        motion_sound, click_sound, loop_sound = self._create_material_sounds(
+            idx, mat_key, self.materials[mat_key], self.config['sound']
+        )
+        self._mat_motion_sound[idx] = motion_sound
+        self._mat_click_sound[idx] = click_sound
+        self._mat_loop_sound[idx] = loop_sound
+        self._mat_built[idx] = True
+    
+    def _create_material_sounds(self, idx, mat_key, mat_props, snd_cfg):
+        """
+        특정 재질의 모든 사운드 생성 (HapticRenderer의 LRU 캐시를 통해 중복 생성 방지)
+        
+        Returns:
+        - tuple: (ra_motion_sound, ra_click_sound, ra_motion_loop_sound)
+        """
+        renderer = self.haptic_renderer
+        
         # RA Motion 사운드
-        ra_motion_hz = int(snd_cfg['ra_motion_base_hz'] * mat_props['f'])
-        ra_motion_cache_key = f"ra_motion_{mat_key}_{ra_motion_hz}"
+        ra_motion_hz = int(self._ra_motion_hz[idx])
         
         if 'type' in mat_props:
             material_params = {k: v for k, v in mat_props.items() if k not in ['r', 'f', 'type']}
-            self.sound_cache[ra_motion_cache_key] = self.haptic_renderer.create_material_sound(
+            ra_motion_sound = renderer.create_material_sound(
                 mat_props['type'], ra_motion_hz, snd_cfg['ra_motion_ms'], 
                 snd_cfg['ra_motion_base_amp'], fade_out_ms=10, **material_params
             )
         else:
-            self.sound_cache[ra_motion_cache_key] = self.haptic_renderer.create_sound_object(
+            ra_motion_sound = renderer.create_sound_object(
                 ra_motion_hz, snd_cfg['ra_motion_ms'], snd_cfg['ra_motion_base_amp'], fade_out_ms=10
             )
         
         # RA Click 사운드  
-        ra_click_hz = int(snd_cfg['ra_click_hz'] * mat_props['f'])
-        ra_click_cache_key = f"ra_click_{mat_key}_{ra_click_hz}"
+        ra_click_hz = int(self._ra_click_hz[idx])
         
         # RA 클릭은 저주파 딸깍 사운드로 변경 (재질 무관)
         click_amp = snd_cfg['ra_click_amp']  # 볼륨 증가 제거
-        self.sound_cache[ra_click_cache_key] = self.haptic_renderer.create_ra_click_sound(
+        ra_click_sound = renderer.create_ra_click_sound(
             ra_click_hz, snd_cfg['ra_click_ms'], click_amp, fade_out_ms=5
         )
         
         # RA Motion Loop 사운드 (연속 재생용)
         loop_duration_ms = 2000
-        ra_loop_cache_key = f"ra_motion_loop_{mat_key}_{ra_motion_hz}"
         
         if 'type' in mat_props:
-            material_params = {k: v for k, v in mat_props.items() if k not in ['r', 'f', 'type']}
-            self.sound_cache[ra_loop_cache_key] = self.haptic_renderer.create_material_sound(
+            ra_motion_loop_sound = renderer.create_material_sound(
                 mat_props['type'], ra_motion_hz, loop_duration_ms, 
                 snd_cfg['ra_motion_base_amp'], fade_out_ms=0, **material_params
             )
         else:
-            self.sound_cache[ra_loop_cache_key] = self.haptic_renderer.create_sound_object(
+            ra_motion_loop_sound = renderer.create_sound_object(
                 ra_motion_hz, loop_duration_ms, snd_cfg['ra_motion_base_amp'], fade_out_ms=0
             )
         
-        print(f"🎵 Created {mat_key} sounds: Motion({ra_motion_hz}Hz), Click({ra_click_hz}Hz)")
-    
-    def _update_current_material_sounds(self):
-        """현재 재질의 사운드들을 설정"""
-        mat_props = self.materials[self.current_material_key]
-        snd_cfg = self.config['sound']
-        
-        # 현재 재질의 주파수 계산
-        ra_motion_hz = int(snd_cfg['ra_motion_base_hz'] * mat_props['f'])
-        ra_click_hz = int(snd_cfg['ra_click_hz'] * mat_props['f'])
-        
-        # 캐시에서 사운드 가져오기
-        self.ra_motion_sound = self.sound_cache[f"ra_motion_{self.current_material_key}_{ra_motion_hz}"]
-        self.ra_click_sound = self.sound_cache[f"ra_click_{self.current_material_key}_{ra_click_hz}"]
-        self.ra_motion_loop_sound = self.sound_cache[f"ra_motion_loop_{self.current_material_key}_{ra_motion_hz}"]
+        if self._verbose:  # change_material 경로에서도 호출되므로 즉시 출력하지 않음
+            self._log_buf.append(("🎵 Created {} sounds: Motion({}Hz), Click({}Hz)", (mat_key, ra_motion_hz, ra_click_hz)))
+        return ra_motion_sound, ra_click_sound, ra_motion_loop_sound
     
     def change_material(self, material_index):
         """재질 변경 (0-6 인덱스)"""
         if 0 <= material_index < len(self.material_keys):
             old_material = self.current_material_key
+            self._current_idx = material_index
             self.current_material_key = self.material_keys[material_index]
-            self.current_roughness = self.materials[self.current_material_key]['r']
+            self.current_roughness = self._mat_roughness[material_index]
             
             # 기존 연속 사운드 중지
-            if self.audio_player.is_continuous_playing(1):
+            if self._continuous_on:
                 self.audio_player.stop_continuous_sound(1)
+                self._continuous_on = False
             
-            # 새로운 재질의 사운드들 설정
-            self._update_current_material_sounds()
+            # 새로운 재질의 사운드들 설정 (처음 선택된 재질이면 이때 생성)
+            self._ensure_material_sounds(material_index)
+            self.ra_motion_sound = self._mat_motion_sound[material_index]
+            self.ra_click_sound = self._mat_click_sound[material_index]
+            self.ra_motion_loop_sound = self._mat_loop_sound[material_index]
             
             # 새로운 연속 사운드 시작
-            self.audio_player.start_continuous_sound(
+            self._continuous_on = self.audio_player.start_continuous_sound(
                 self.ra_motion_loop_sound, channel_id=1, initial_volume=self.current_volume
             )
             
-            print(f"🔄 Material changed: {old_material} → {self.current_material_key}")
+            if self._verbose:
+                self._log_buf.append(("🔄 Material changed: {} → {}", (old_material, self.current_material_key)))
             return True
         return False
     
@@ -183,129 +287,168 @@ class HapticSystem:
         Returns:
         - tuple: (sa_fired, ra_motion_fired, ra_click_fired, sa_vu, ra_motion_vu, ra_click_vu)
         """
-        current_time = time.perf_counter()
+        self._step_i += 1
         
         # === 1. 스파이크 생성 ===
-        sa_fired, ra_motion_fired, ra_click_fired, sa_vu, ra_motion_vu, ra_click_vu = self.spike_encoder.step(
-            mouse_speed=mouse_speed,
-            avg_mouse_speed=avg_mouse_speed,
-            material_roughness=self.current_roughness,
-            mouse_pressed=self.mouse_pressed
+        sa_fired, ra_motion_fired, ra_click_fired, sa_vu, ra_motion_vu, ra_click_vu = self._encode(
+            mouse_speed, avg_mouse_speed, self.current_roughness, self.mouse_pressed
         )
         
         # === 2. 스파이크 → 사운드 재생 ===
         if sa_fired:
-            volume = self.config['sound']['sa_sound_volume']
-            self.audio_player.play_sound(self.sa_sound, channel_id=0, volume=volume)
-            print(f"🔴 SA SPIKE! Volume: {volume:.2f}")
+            volume = self._sa_vol
+            self._play_sound(self.sa_sound, channel_id=0, volume=volume)
+            if self._verbose:
+                self._log_buf.append(("🔴 SA SPIKE! Volume: {:.2f}", (volume,)))
         
         if ra_click_fired:
-            volume = self.config['sound']['ra_click_volume']
-            self.audio_player.play_sound(self.ra_click_sound, channel_id=2, volume=volume)
-            print(f"🟡 RA CLICK SPIKE! Volume: {volume:.2f}")
+            volume = self._click_vol
+            self._play_sound(self.ra_click_sound, channel_id=2, volume=volume)
+            if self._verbose:
+                self._log_buf.append(("🟡 RA CLICK SPIKE! Volume: {:.2f}", (volume,)))
         
         # === 3. RA Motion 연속 사운드 볼륨 제어 ===
-        self._update_ra_motion_volume(ra_motion_fired, current_time)
+        self._update_ra_motion_volume(ra_motion_fired, self._step_i)
         
         return sa_fired, ra_motion_fired, ra_click_fired, sa_vu, ra_motion_vu, ra_click_vu
     
-    def _update_ra_motion_volume(self, ra_motion_fired, current_time):
-        """RA Motion 연속 사운드 볼륨 업데이트"""
-        # 스파이크 히스토리 기록
-        self.ra_motion_spike_timestamps.append((current_time, ra_motion_fired))
-        
-        # 스파이크 발생률 계산 (주기적으로)
-        self.spike_rate_update_counter += 1
-        if self.spike_rate_update_counter >= self.spike_rate_update_interval:
-            self.current_spike_rate = self._calculate_spike_rate(current_time)
-            self.spike_rate_update_counter = 0
-        
-        # 목표 볼륨 계산
-        if self.mouse_pressed and self.current_spike_rate > 0:
-            self.target_volume = self._spike_rate_to_volume(self.current_spike_rate)
-        else:
-            self.target_volume = 0.0
-        
-        # 볼륨 스무딩 (증가 시 부드럽게, 감소 시 빠르게)
-        if self.target_volume > self.current_volume:
-            smooth_factor = self.volume_smooth_factor
-        else:
-            smooth_factor = self.volume_fast_decay_factor
-        
-        self.current_volume += (self.target_volume - self.current_volume) * smooth_factor
+    def step_many(self, mouse_speeds, avg_mouse_speeds):
+        """
+        여러 스텝을 한 번에 실행하는 배치 버전 (오프라인 분석/회귀 테스트용)
         
-        # 작은 차이는 목표값으로 스냅
-        if abs(self.current_volume - self.target_volume) < 0.005:
-            self.current_volume = self.target_volume
+        스파이크 생성, 스파이크 발생률, RA Motion 볼륨 궤적을 NumPy로 한꺼번에 계산.
+        내부 상태(뉴런, 스텝 카운터, 스파이크 윈도우, 볼륨)는 step()을 반복 호출한 것과
+        같이 갱신되지만 사운드는 재생하지 않음 (필요하면 반환된 스파이크 배열로 구동).
         
-        # 연속 사운드 볼륨 설정
-        if self.audio_player.is_continuous_playing(1):
-            self.audio_player.set_continuous_volume(1, self.current_volume)
+        Returns:
+        - tuple: (fired, states, spike_rates, volumes)
+          - fired: 스텝별 스파이크 여부 [SA, RA motion, RA click] (bool, shape: T x 3)
+          - states: 스텝별 뉴런 (v, u) (shape: T x 3 x 2)
+          - spike_rates: 스텝별 RA Motion 스파이크 발생률 (Hz, shape: T)
+          - volumes: 스텝별 RA Motion 연속 사운드 볼륨 (shape: T)
+        """
+        fired, states = self.spike_encoder.step_many(
+            mouse_speeds, avg_mouse_speeds, self.current_roughness, self.mouse_pressed
+        )
+        n_steps = fired.shape[0]
+        if n_steps == 0:
+            return fired, states, np.zeros(0), np.zeros(0)
+        
+        # === 스텝 인덱스 및 RA Motion 스파이크 스텝 ===
+        steps = self._step_i + 1 + np.arange(n_steps, dtype=np.int64)
+        new_spike_steps = steps[fired[:, 1]]
+        
+        # === 윈도우 내 스파이크 개수 (이전 배치/스텝에서 남은 스파이크 포함) ===
+        mask = self._SPIKE_BUF_MASK
+        prev_spike_steps = self._spike_steps[np.arange(self._spike_head, self._spike_tail) & mask]
+        all_spike_steps = np.concatenate((prev_spike_steps, new_spike_steps))
+        cutoff_steps = steps - self._window_steps
+        spike_counts = (np.searchsorted(all_spike_steps, steps, side='right')
+                        - np.searchsorted(all_spike_steps, cutoff_steps, side='left'))
+        
+        # === 스파이크 발생률 ===
+        durations = np.clip((steps - 1) * self._dt_sec, 0.005, self.spike_window_duration_sec)
+        spike_rates = spike_counts / durations
+        
+        # === 볼륨 궤적 (구간 선형 매핑 + 스무딩) ===
+        if self.mouse_pressed:
+            targets = np.interp(spike_rates, [self._min_spike_rate, self._max_spike_rate],
+                                [self._min_vol, self._max_vol])
+            targets[spike_rates <= 0.0] = 0.0
+        else:
+            targets = np.zeros(n_steps)
+        volumes = _smooth_volumes(targets, self.current_volume, self._smooth_factors)
+        
+        # === 내부 상태를 배치 끝 시점으로 갱신 ===
+        for spike_step in new_spike_steps[-self._SPIKE_BUF_SIZE:].tolist():
+            self._spike_steps[self._spike_tail & mask] = spike_step
+            self._spike_tail += 1
+        self._spike_head = max(self._spike_head, self._spike_tail - self._SPIKE_BUF_SIZE)
+        self._step_i = int(steps[-1])
+        self._calculate_spike_rate(self._step_i)  # 윈도우 밖 스파이크 정리
+        self.current_spike_rate = float(spike_rates[-1])
+        self.target_volume = float(targets[-1])
+        self.current_volume = float(volumes[-1])
+        
+        return fired, states, spike_rates, volumes
+    
+    def _update_ra_motion_volume(self, ra_motion_fired, step_i):
+        """RA Motion 연속 사운드 볼륨 업데이트"""
+        # 스파이크 히스토리 기록 (발생한 경우만)
+        if ra_motion_fired:
+            self._spike_steps[self._spike_tail & self._SPIKE_BUF_MASK] = step_i
+            self._spike_tail += 1
+            if self._spike_tail - self._spike_head > self._SPIKE_BUF_SIZE:
+                self._spike_head = self._spike_tail - self._SPIKE_BUF_SIZE
+        
+        # 스파이크 발생률 계산 (간격 제한 없이 매 스텝 - 링 버퍼라 O(1))
+        self.current_spike_rate = self._calculate_spike_rate(step_i)
+        
+        # 목표 볼륨 계산 + 스무딩
+        self.target_volume, self.current_volume = _compute_volume(
+            self.current_spike_rate, self.current_volume, self.mouse_pressed,
+            self._min_spike_rate, self._max_spike_rate, self._min_vol, self._max_vol,
+            self._smooth_factors
+        )
         
-        # 볼륨 업데이트
-        self.audio_player.update_volumes()
+        # 연속 사운드 볼륨 설정 + 볼륨 업데이트
+        self._tick_continuous(1, self.current_volume)
         
         # 볼륨 변화 로깅 (큰 변화만)
-        if hasattr(self, 'last_logged_volume'):
-            if abs(self.current_volume - self.last_logged_volume) > 0.05:
-                print(f"🔵 RA MOTION Volume: {self.current_volume:.2f} (target: {self.target_volume:.2f}, rate: {self.current_spike_rate:.1f}Hz)")
-                self.last_logged_volume = self.current_volume
-        else:
+        if self._verbose and abs(self.current_volume - self.last_logged_volume) > 0.05:
+            self._log_buf.append(("🔵 RA MOTION Volume: {:.2f} (target: {:.2f}, rate: {:.1f}Hz)",
+                                  (self.current_volume, self.target_volume, self.current_spike_rate)))
             self.last_logged_volume = self.current_volume
     
-    def _calculate_spike_rate(self, current_time):
+    def _calculate_spike_rate(self, step_i):
         """스파이크 발생률 계산 (spikes/second)"""
-        cutoff_time = current_time - self.spike_window_duration_sec
+        cutoff_step = step_i - self._window_steps
         
-        # 오래된 기록 제거
-        while self.ra_motion_spike_timestamps and self.ra_motion_spike_timestamps[0][0] < cutoff_time:
-            self.ra_motion_spike_timestamps.popleft()
+        # 윈도우 밖으로 나간 스파이크 제거 (head 전진)
+        spike_steps = self._spike_steps
+        mask = self._SPIKE_BUF_MASK
+        head, tail = self._spike_head, self._spike_tail
+        while head < tail and spike_steps[head & mask] < cutoff_step:
+            head += 1
+        self._spike_head = head
         
-        # 윈도우 내 스파이크 개수
-        spike_count = sum(1 for timestamp, spike_occurred in self.ra_motion_spike_timestamps if spike_occurred)
+        # 윈도우 내 스파이크 개수: tail은 스파이크 기록 시, head는 만료 시에만 증가하므로
+        # 두 카운터의 차이가 곧 증분 유지되는 개수 (윈도우 전체 순회 없이 O(1))
+        spike_count = tail - head
         
-        # 실제 윈도우 지속시간
-        if len(self.ra_motion_spike_timestamps) > 0:
-            oldest_time = self.ra_motion_spike_timestamps[0][0]
-            actual_duration = current_time - oldest_time
-            effective_duration = max(min(actual_duration, self.spike_window_duration_sec), 0.005)
-        else:
-            effective_duration = self.spike_window_duration_sec
+        # 실제 윈도우 지속시간 (시작 직후에는 윈도우보다 짧음)
+        actual_duration = (step_i - 1) * self._dt_sec
+        effective_duration = max(min(actual_duration, self.spike_window_duration_sec), 0.005)
         
-        return spike_count / effective_duration if effective_duration > 0 else 0.0
+        return spike_count / effective_duration
     
-    def _spike_rate_to_volume(self, spike_rate):
-        """스파이크 발생률을 볼륨으로 변환"""
-        snd_cfg = self.config['sound']
+    def refresh_volume_settings(self):
+        """
+        볼륨 관련 설정을 다시 읽어 캐시 (GUI 볼륨 조절 후 호출)
         
-        min_spike_rate = 20.0
-        max_spike_rate = 120.0
-        min_volume = snd_cfg['ra_motion_min_vol_scl']
-        max_volume = snd_cfg['ra_motion_max_vol_scl']
-        
-        if spike_rate <= 0:
-            return 0.0
-        elif spike_rate <= min_spike_rate:
-            return min_volume
-        elif spike_rate >= max_spike_rate:
-            return max_volume
-        else:
-            volume_range = max_volume - min_volume
-            rate_range = max_spike_rate - min_spike_rate
-            volume = min_volume + ((spike_rate - min_spike_rate) / rate_range) * volume_range
-            return np.clip(volume, 0.0, 1.0)
+        config['sound']의 볼륨과 volume_smooth_factor / volume_fast_decay_factor를
+        numba 커널이 읽는 배열로 다시 만듦 (스무딩 계수를 바꾼 뒤에도 호출)
+        """
+        snd_cfg = self.config['sound']
+        # [감소 시 계수, 증가 시 계수] (_compute_volume / _smooth_volumes 인덱스 순서)
+        self._smooth_factors = np.array([self.volume_fast_decay_factor, self.volume_smooth_factor])
+        self._sa_vol = snd_cfg['sa_sound_volume']
+        self._click_vol = snd_cfg['ra_click_volume']
+        self._min_vol = float(snd_cfg['ra_motion_min_vol_scl'])
+        self._max_vol = float(snd_cfg['ra_motion_max_vol_scl'])
     
     def mouse_press(self, click_magnitude=None):
         """마우스 클릭 처리"""
         self.mouse_pressed = True
         if click_magnitude is None:
-            click_magnitude = self.config['input_current']['click_mag']
+            click_magnitude = self._click_mag
         self.spike_encoder.update_sa_input(click_magnitude)
         
         # RA 클릭 사운드 즉시 재생 (hover 시 들리도록)
-        volume = self.config['sound']['ra_click_volume']
-        self.audio_player.play_sound(self.ra_click_sound, channel_id=2, volume=volume)
-        print(f"🟡 MANUAL RA CLICK! Volume: {volume:.2f}")
+        volume = self._click_vol
+        self._play_sound(self.ra_click_sound, channel_id=2, volume=volume)
+        if self._verbose:
+            self._log_buf.append(("🟡 MANUAL RA CLICK! Volume: {:.2f}", (volume,)))
 
     def mouse_release(self):
         """마우스 릴리즈 처리"""
@@ -315,15 +458,26 @@ class HapticSystem:
         # 즉시 볼륨 0으로
         self.target_volume = 0.0
         self.current_volume = 0.0
-        if self.audio_player.is_continuous_playing(1):
+        if self._continuous_on:
             self.audio_player.set_continuous_volume(1, 0.0)
     
+    def _drain_log(self):
+        """로그 버퍼를 10Hz로 비워 출력 (백그라운드 데몬 스레드)"""
+        buf = self._log_buf
+        while not self._log_stop.wait(0.1):
+            while buf:
+                fmt, args = buf.popleft()
+                print(fmt.format(*args))
+    
     def cleanup(self):
         """시스템 정리"""
+        self._log_stop.set()
         if hasattr(self, 'audio_player'):
             # 모든 연속 사운드 중지
             if hasattr(self.audio_player, 'continuous_channels'):
                 for channel_id in list(self.audio_player.continuous_channels.keys()):
                     self.audio_player.stop_continuous_sound(channel_id)
+            self._continuous_on = False
+            self.haptic_renderer.clear_cache()
             self.audio_player.quit()
         print("🧹 Haptic system cleaned up!") 
\ No newline at end of file
@@ -1,12 +1,41 @@
 import pygame
 import sys
-import numpy as np
+import logging
+import math
 import time
-from collections import deque
+import threading
+import numpy as np
 
 # 기존 햅틱 시스템 모듈들 임포트
 from core.config import get_haptic_config
 from core.haptic_system import HapticSystem
+from utils.jit import njit, NUMBA_AVAILABLE
+
+# 입력/햅틱 이벤트 로그 (기본 WARNING 레벨에서는 debug 메시지를 포맷하지 않음)
+log = logging.getLogger(__name__)
+
+# 창이 가려졌다 다시 보이거나 복원될 때 오는 이벤트 (화면 전체를 다시 그려야 함)
+# pygame/SDL 버전에 따라 없는 상수는 제외
+_EXPOSE_EVENTS = tuple(
+    getattr(pygame, name) for name in (
+        "WINDOWEVENT", "VIDEOEXPOSE", "ACTIVEEVENT", "WINDOWEXPOSED",
+        "WINDOWSHOWN", "WINDOWRESTORED", "WINDOWMAXIMIZED", "WINDOWDISPLAYCHANGED",
+    ) if hasattr(pygame, name)
+)
+
+# 메인 루프에서 처리하는 이벤트 타입 (나머지는 큐에 쌓이지 않도록 차단)
+_HANDLED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+                   pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION) + _EXPOSE_EVENTS
+
+
+@njit(cache=True)
+def _hittest(rects, px, py):
+    """(x0, y0, x1, y1) 사각형 배열에서 (px, py)를 포함하는 첫 사각형 인덱스 반환 (없으면 -1)"""
+    for i in range(rects.shape[0]):
+        if rects[i, 0] <= px < rects[i, 2] and rects[i, 1] <= py < rects[i, 3]:
+            return i
+    return -1
+
 
 class AutomotiveClimateGUI:
     def __init__(self):
@@ -17,6 +46,8 @@ class AutomotiveClimateGUI:
         self.height = 600
         self.screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption("Vehicle Climate Control")
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_HANDLED_EVENTS)
         
         # 색상 정의 - 실제 차량 스타일
         self.BLACK = (15, 15, 20)             # 어두운 배경
@@ -26,12 +57,25 @@ class AutomotiveClimateGUI:
         self.GRAY_INACTIVE = (120, 120, 130)  # 비활성화
         self.GREEN_ACTIVE = (100, 255, 120)   # 초록색 (자동/에코)
         self.RED_ACTIVE = (255, 100, 100)     # 빨간색 (경고/디프로스트)
+        # hover 글로우 색상 (기본 색상별 +80 밝게, 미리 계산)
+        self._glow = {color: tuple(min(255, c + 80) for c in color)
+                      for color in (self.WHITE, self.BLUE_ACTIVE, self.ORANGE_ACTIVE, self.GRAY_INACTIVE,
+                                    self.GREEN_ACTIVE, self.RED_ACTIVE)}
         
         # 폰트 설정
         self.font_large = pygame.font.Font(None, 48)
         self.font_medium = pygame.font.Font(None, 36)
         self.font_small = pygame.font.Font(None, 28)
         self.font_icon = pygame.font.Font(None, 42)  # 아이콘용
+        # 버튼 아이콘 폰트 (기본 32 × 상태 배율 1.0/1.1/1.2 × hover 배율 1.0/1.25 조합)
+        self._icon_fonts = {}
+        for scale in (1.0, 1.1, 1.2):
+            for hover_scale in (1.0, 1.25):
+                size = int(32 * (scale * hover_scale))  # draw_button과 같은 순서로 계산
+                self._icon_fonts[size] = pygame.font.Font(None, size)
+        
+        # 렌더링된 텍스트 Surface 캐시 (키: 텍스트, 폰트, 색상)
+        self._text_cache = {}
         
         # 공조기 상태
         self.climate_state = {
@@ -56,15 +100,63 @@ class AutomotiveClimateGUI:
         self.haptic_system = HapticSystem(self.config)
         self.haptic_system.change_material(3)  # Plastic (차량 내부)
         
+        # 햅틱 스텝 스레드 (화면 60 FPS와 별개로 neuron_dt_ms 주기로 step)
+        self._haptic_period = self.config['neuron_dt_ms'] / 1000.0
+        self._haptic_lock = threading.Lock()  # haptic_system 호출 직렬화 (GUI 스레드 ↔ 햅틱 스레드)
+        self._haptic_running = False
+        self._haptic_thread = None
+        # GUI → 햅틱 스레드 단일 슬롯 샘플 (최신값으로 덮어씀): (hover 여부, 속도, 평균 속도, 정지 판정 시각)
+        self._hsample = (False, 0.0, 0.0, 0.0)
+        self._haptic_cv = threading.Condition()
+        
         # 버튼들 생성 - 실제 차량 레이아웃
         self.buttons = self.create_vehicle_buttons()
+        # hover/클릭 판정용: 버튼 행의 y 밴드 + (numba 있으면) 사각형 (x0, y0, x1, y1) 테이블,
+        # 없으면 (사각형, 버튼) 목록을 collidepoint로 순회
+        if NUMBA_AVAILABLE:
+            self._rects = np.array([[b["rect"].left, b["rect"].top, b["rect"].right, b["rect"].bottom]
+                                    for b in self.buttons], dtype=np.int32)
+        self._hit_rects = [(b["rect"], b) for b in self.buttons]
+        self._hit_bands = sorted({(b["rect"].top, b["rect"].bottom) for b in self.buttons})
+        
+        # 풍량 조절 바 사각형 (fan_control 버튼 위치 기준)
+        fan_control = next(b for b in self.buttons if b["name"] == "fan_control")
+        self._fan_bar_rect, self._fan_seg_rects = self._build_fan_bar_rects(fan_control["x"], fan_control["y"])
+        
+        # 버튼 action 이름 → 처리 메서드
+        self._actions = {
+            'toggle_left_seat_heat': self._toggle_left_seat_heat,
+            'toggle_right_seat_heat': self._toggle_right_seat_heat,
+            'toggle_driver_only': self._toggle_driver_only,
+            'increase_fan': self._increase_fan,
+            'decrease_fan': self._decrease_fan,
+            'temp_control': self._temp_control,
+            'toggle_steering_heat': self._toggle_steering_heat,
+            'toggle_left_seat_cool': self._toggle_left_seat_cool,
+            'toggle_right_seat_cool': self._toggle_right_seat_cool,
+            'toggle_system_off': self._toggle_system_off,
+            'toggle_ac': self._toggle_ac,
+            'toggle_circulation': self._toggle_circulation,
+            'toggle_front_defrost': self._toggle_front_defrost,
+        }
+        
+        # 더티 렉트 렌더링 (변경된 영역만 다시 그리고 그 영역만 화면 갱신)
+        self._hud_top_rect = pygame.Rect(0, 0, self.width, 140)                 # 제목/상태/시트
+        self._hud_bottom_rect = pygame.Rect(0, self.height - 70, self.width, 70)  # hover/햅틱 상태
+        self._dirty_rects = [self.screen.get_rect()]  # 첫 프레임은 전체 그리기
+        self._dirty = True
+        self._bg = self._build_background()
         
         # 마우스 상태
         self.mouse_pressed = False
         self.last_mouse_pos = (0, 0)
         self.last_mouse_time = time.perf_counter()
         self.mouse_speed = 0.0
-        self.speed_history = deque(maxlen=10)
+        # 최근 10개 속도 링 버퍼 (사전 할당, 합계를 유지해 평균을 O(1)로)
+        self._speed_hist = np.zeros(10, dtype=np.float32)
+        self._speed_hi = 0       # 다음 기록 위치
+        self._speed_hn = 0       # 기록된 샘플 수 (최대 10)
+        self._speed_sum = 0.0
         self.avg_mouse_speed = 0.0
         
         # 버튼 hover 상태 추적
@@ -72,13 +164,16 @@ class AutomotiveClimateGUI:
         self.prev_hovered_button = None
         self.hover_start_time = 0.0
         self.hover_feedback_sent = False  # hover 피드백 중복 방지
+        self._last_hover_pulse_ts = float('-inf')  # 마지막 hover 펄스 시각
+        self._last_exit_pulse_ts = float('-inf')  # 마지막 이탈 펄스 시각
         
         # 설정
         self.max_speed_clamp = 100000.0
         self.mouse_stop_threshold = 0.02
         self.min_mouse_delta_time = 0.0001
+        self.haptic_debounce_sec = 0.04  # hover/이탈 펄스 최소 간격 (빠르게 훑을 때 펄스 폭주 방지)
+        self._stop_deadline = self.last_mouse_time + self.mouse_stop_threshold  # 이 시각이 지나면 정지로 간주
         
-        self.clock = pygame.time.Clock()
         print("Vehicle Climate Control initialized")
         
     def create_vehicle_buttons(self):
@@ -171,6 +266,7 @@ class AutomotiveClimateGUI:
             btn.update({
                 "y": top_y,
                 "rect": pygame.Rect(btn["x"] - 80, top_y - 50, 160, 100),
+                "area": pygame.Rect(btn["x"] - 85, top_y - 55, 170, 110),  # 글로우 포함 그리기 영역
                 "type": btn.get("type", "control")
             })
             buttons.append(btn)
@@ -180,12 +276,71 @@ class AutomotiveClimateGUI:
             btn.update({
                 "y": bottom_y,
                 "rect": pygame.Rect(btn["x"] - 80, bottom_y - 50, 160, 100),
+                "area": pygame.Rect(btn["x"] - 85, bottom_y - 55, 170, 110),  # 글로우 포함 그리기 영역
                 "type": btn.get("type", "control")
             })
             buttons.append(btn)
             
         return buttons
     
+    def _hit_test(self, pos):
+        """pos 아래 버튼 반환 (겹치는 영역은 self.buttons 순서상 앞 버튼, 없으면 None)"""
+        px, py = pos
+        # 버튼 행의 y 밴드 밖이면 바로 제외
+        for top, bottom in self._hit_bands:
+            if top <= py < bottom:
+                break
+        else:
+            return None
+        
+        if NUMBA_AVAILABLE:
+            hit = _hittest(self._rects, px, py)
+            return self.buttons[hit] if hit >= 0 else None
+        
+        # numba가 없으면 파이썬 루프로 도는 _hittest보다 collidepoint(C 구현)가 빠름
+        for rect, button in self._hit_rects:
+            if rect.collidepoint(px, py):
+                return button
+        return None
+    
+    def _build_background(self):
+        """
+        바뀌지 않는 부분(배경색, 제목, 비활성 상태의 컨트롤 버튼)을 미리 그린 배경 Surface 생성
+        
+        다른 버튼과 영역이 겹치는 버튼(팬/온도 주변)은 그리는 순서가 결과에 영향을 주므로
+        배경에 넣지 않고 매번 순서대로 그림
+        """
+        bg = pygame.Surface((self.width, self.height)).convert()  # 불투명, 화면과 같은 픽셀 포맷
+        bg.fill(self.BLACK)
+        bg.blit(self._render("Vehicle Climate Control System", self.font_large, self.WHITE), (50, 30))
+        for button in self.buttons:
+            isolated = not any(other is not button and button["area"].colliderect(other["area"])
+                               for other in self.buttons)
+            button["in_bg"] = button["type"] == "control" and isolated
+            if button["in_bg"]:
+                self.draw_button(button, bg, static=True)
+                button["bg_label"] = (button["icon"], button["text"])  # 배경에 그려진 라벨
+        return bg
+    
+    def _is_overlay(self, button):
+        """배경 Surface에 없거나 배경의 비활성 모습과 다르게 그려야 하는 버튼인지 (활성/hover/라벨 변경)"""
+        return (not button["in_bg"] or button.get("active") or self.hovered_button == button
+                or (button["icon"], button["text"]) != button["bg_label"])
+    
+    def mark_dirty(self, rect=None):
+        """다시 그릴 영역 등록 (rect 생략 시 화면 전체)"""
+        self._dirty_rects.append(rect if rect is not None else self.screen.get_rect())
+        self._dirty = True
+    
+    def _render(self, text, font, color):
+        """텍스트 Surface 반환 (같은 텍스트/폰트/색상 조합은 한 번만 래스터화)"""
+        key = (text, font, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color).convert_alpha()  # 화면 픽셀 포맷으로 맞춰 빠른 블릿
+            self._text_cache[key] = surface
+        return surface
+    
     def get_button_color(self, color_name):
         """버튼 색상 반환"""
         colors = {
@@ -197,9 +352,19 @@ class AutomotiveClimateGUI:
         }
         return colors.get(color_name, self.WHITE)
     
-    def draw_button(self, button):
-        """버튼 그리기 - 실제 차량 스타일"""
+    def draw_button(self, button, surface=None, static=False):
+        """
+        버튼 그리기 - 실제 차량 스타일
+        
+        Parameters:
+        - surface: 그릴 대상 (기본 self.screen)
+        - static: True면 활성/hover와 무관한 비활성 모습으로 그리기 (배경 Surface용)
+        """
+        if surface is None:
+            surface = self.screen
         x, y = button["x"], button["y"]
+        active = not static and button.get("active")
+        hovered = not static and self.hovered_button == button
         
         # 활성 상태에 따른 색상
         if button.get("type") in ["fan_display", "temp_display"]:
@@ -207,7 +372,7 @@ class AutomotiveClimateGUI:
             color = self.WHITE
             text_color = self.WHITE
             icon_scale = 1.1
-        elif button.get("active"):
+        elif active:
             color = self.get_button_color(button.get("color", "white"))
             text_color = color
             icon_scale = 1.2
@@ -217,151 +382,193 @@ class AutomotiveClimateGUI:
             icon_scale = 1.0
         
         # 호버 상태 강조 (풍량 바는 호버 효과 없음)
-        if self.hovered_button == button and button.get("type") != "fan_display":
+        if hovered and button.get("type") != "fan_display":
             # 글로우 효과
-            glow_color = tuple(min(255, c + 80) for c in color[:3])
-            pygame.draw.rect(self.screen, glow_color, 
+            glow_color = self._glow[color]
+            pygame.draw.rect(surface, glow_color, 
                            (x - 85, y - 55, 170, 110), 3)
             icon_scale *= 1.25
         
         # 버튼 배경 (미묘한 테두리) - 풍량 바는 배경 없음
-        if (button.get("active") or self.hovered_button == button) and button.get("type") != "fan_display":
-            pygame.draw.rect(self.screen, color, 
+        if (active or hovered) and button.get("type") != "fan_display":
+            pygame.draw.rect(surface, color, 
                            (x - 75, y - 45, 150, 90), 2)
         
         # 풍량 조절 바 특별 그리기
         if button["name"] == "fan_control":
-            self.draw_fan_control_bar(x, y, text_color)
+            self.draw_fan_control_bar(surface)
         else:
             # 일반 아이콘 그리기
             icon_size = int(32 * icon_scale)
-            icon_font = pygame.font.Font(None, icon_size)
-            icon_surface = icon_font.render(button["icon"], True, text_color)
+            icon_surface = self._render(button["icon"], self._icon_fonts[icon_size], text_color)
             icon_rect = icon_surface.get_rect(center=(x, y - 10))
-            self.screen.blit(icon_surface, icon_rect)
+            surface.blit(icon_surface, icon_rect)
         
         # 텍스트 라벨 (작게)
         text_lines = button["text"].split('\n')
         for i, line in enumerate(text_lines):
-            text_surface = self.font_small.render(line, True, text_color)
+            text_surface = self._render(line, self.font_small, text_color)
             text_rect = text_surface.get_rect(center=(x, y + 25 + i*15))
-            self.screen.blit(text_surface, text_rect)
+            surface.blit(text_surface, text_rect)
     
-    def draw_fan_control_bar(self, x, y, color):
-        """풍량 조절 바 그리기 - 이미지에 있던 스타일"""
+    def _build_fan_bar_rects(self, x, y):
+        """
+        풍량 조절 바 사각형 미리 계산
+        
+        Returns:
+        - tuple: (배경 바 Rect, 1~5단계 세그먼트 Rect 튜플)
+        """
         bar_width = 80
         bar_height = 8
         segments = 5
         
+        bar_rect = pygame.Rect(x - bar_width//2, y - bar_height//2, bar_width, bar_height)
+        segment_width = bar_width / segments
+        segment_rects = tuple(
+            pygame.Rect(x - bar_width//2 + i * segment_width + 2, y - bar_height//2 + 2,
+                        segment_width - 4, bar_height - 4)
+            for i in range(segments)
+        )
+        return bar_rect, segment_rects
+    
+    def draw_fan_control_bar(self, surface=None):
+        """풍량 조절 바 그리기 - 이미지에 있던 스타일 (위치는 __init__에서 fan_control 버튼 기준으로 미리 계산)"""
+        if surface is None:
+            surface = self.screen
+        
         # 배경 바
-        pygame.draw.rect(self.screen, self.GRAY_INACTIVE, 
-                        (x - bar_width//2, y - bar_height//2, bar_width, bar_height))
+        pygame.draw.rect(surface, self.GRAY_INACTIVE, self._fan_bar_rect)
         
         # 활성화된 세그먼트들
-        segment_width = bar_width / segments
-        for i in range(self.climate_state['fan_speed']):
-            segment_x = x - bar_width//2 + i * segment_width
-            segment_color = self.BLUE_ACTIVE if i < self.climate_state['fan_speed'] else self.GRAY_INACTIVE
-            pygame.draw.rect(self.screen, segment_color,
-                           (segment_x + 2, y - bar_height//2 + 2, segment_width - 4, bar_height - 4))
-    
-    def send_hover_haptic_feedback(self):
-        """버튼 hover 시 강한 햅틱 피드백"""
+        for segment_rect in self._fan_seg_rects[:self.climate_state['fan_speed']]:
+            pygame.draw.rect(surface, self.BLUE_ACTIVE, segment_rect)
+    
+    def send_hover_haptic_feedback(self, current_time):
+        """
+        버튼 hover 시 강한 햅틱 피드백
+        
+        직전 hover 펄스 후 haptic_debounce_sec 이내면 보내지 않고 hover_feedback_sent를
+        False로 남겨 둠 (메인 루프가 간격이 지난 뒤 다시 시도).
+        이탈 펄스와는 간격을 따지지 않음 (hover 펄스 우선)
+        """
+        if self.hover_feedback_sent or current_time - self._last_hover_pulse_ts < self.haptic_debounce_sec:
+            return
         # 강제로 클릭 피드백 발생 (hover 용)
-        if not self.hover_feedback_sent:
+        with self._haptic_lock:
             self.haptic_system.mouse_press()
             self.haptic_system.mouse_release()
-            self.hover_feedback_sent = True
-            print(f"🎯 STRONG HOVER FEEDBACK: {self.hovered_button['name']}")
+        self._last_hover_pulse_ts = current_time
+        self.hover_feedback_sent = True
+        log.debug("🎯 STRONG HOVER FEEDBACK: %s", self.hovered_button['name'])
     
-    def send_exit_haptic_feedback(self, button_name):
-        """버튼 hover 이탈 시 약한 햅틱 피드백"""
+    def send_exit_haptic_feedback(self, button_name, current_time):
+        """버튼 hover 이탈 시 약한 햅틱 피드백 (직전 hover/이탈 펄스 후 haptic_debounce_sec 이내면 생략)"""
+        if (current_time - self._last_hover_pulse_ts < self.haptic_debounce_sec
+                or current_time - self._last_exit_pulse_ts < self.haptic_debounce_sec):
+            return
+        self._last_exit_pulse_ts = current_time
         # 이탈 시에도 클릭 피드백 (더 약하게)
-        self.haptic_system.mouse_press()
-        self.haptic_system.mouse_release()
-        print(f"🔽 EXIT FEEDBACK: {button_name}")
+        with self._haptic_lock:
+            self.haptic_system.mouse_press()
+            self.haptic_system.mouse_release()
+        log.debug("🔽 EXIT FEEDBACK: %s", button_name)
     
     def handle_button_action(self, button):
-        """버튼 액션 처리"""
+        """버튼 액션 처리 (action 이름 → 처리 메서드 디스패치)"""
         action = button.get("action")
         if not action:
             return
-            
-        if action == "toggle_left_seat_heat":
-            self.climate_state['left_seat_heat'] = (self.climate_state['left_seat_heat'] + 1) % 4
-            button["active"] = self.climate_state['left_seat_heat'] > 0
-            print(f"Left Seat Heat: Level {self.climate_state['left_seat_heat']}")
-            
-        elif action == "toggle_right_seat_heat":
-            self.climate_state['right_seat_heat'] = (self.climate_state['right_seat_heat'] + 1) % 4
-            button["active"] = self.climate_state['right_seat_heat'] > 0
-            print(f"Right Seat Heat: Level {self.climate_state['right_seat_heat']}")
-            
-        elif action == "toggle_driver_only":
-            self.climate_state['driver_only'] = not self.climate_state['driver_only']
-            button["active"] = self.climate_state['driver_only']
-            print(f"Driver Only: {'ON' if self.climate_state['driver_only'] else 'OFF'}")
-            
-        elif action == "increase_fan":
-            if self.climate_state['fan_speed'] < 5:
-                self.climate_state['fan_speed'] += 1
-                print(f"Fan Speed: {self.climate_state['fan_speed']}")
-            
-        elif action == "decrease_fan":
-            if self.climate_state['fan_speed'] > 1:
-                self.climate_state['fan_speed'] -= 1
-                print(f"Fan Speed: {self.climate_state['fan_speed']}")
-            
-        elif action == "temp_control":
-            # 온도 조절 (클릭할 때마다 +1)
-            if self.climate_state['temperature'] < 30:
-                self.climate_state['temperature'] += 1
-            else:
-                self.climate_state['temperature'] = 16
-            print(f"Temperature: {self.climate_state['temperature']}°C")
-            
-        elif action == "toggle_steering_heat":
-            self.climate_state['steering_heat'] = not self.climate_state['steering_heat']
-            button["active"] = self.climate_state['steering_heat']
-            print(f"Steering Wheel Heat: {'ON' if self.climate_state['steering_heat'] else 'OFF'}")
-            
-        elif action == "toggle_left_seat_cool":
-            self.climate_state['left_seat_cool'] = not self.climate_state['left_seat_cool']
-            button["active"] = self.climate_state['left_seat_cool']
-            print(f"Left Seat Cool: {'ON' if self.climate_state['left_seat_cool'] else 'OFF'}")
-            
-        elif action == "toggle_right_seat_cool":
-            self.climate_state['right_seat_cool'] = not self.climate_state['right_seat_cool']
-            button["active"] = self.climate_state['right_seat_cool']
-            print(f"Right Seat Cool: {'ON' if self.climate_state['right_seat_cool'] else 'OFF'}")
-            
-        elif action == "toggle_system_off":
-            # 모든 시스템 끄기
-            self.climate_state['ac_on'] = False
-            self.climate_state['heat_on'] = False
-            self.climate_state['auto_mode'] = False
-            self.update_all_buttons()
-            print("System OFF - All functions disabled")
-            
-        elif action == "toggle_ac":
-            self.climate_state['ac_on'] = not self.climate_state['ac_on']
-            button["active"] = self.climate_state['ac_on']
-            if self.climate_state['ac_on']:
-                self.climate_state['heat_on'] = False
-                self.update_button_active('heat', False)
-            print(f"A/C: {'ON' if self.climate_state['ac_on'] else 'OFF'}")
-            
-        elif action == "toggle_circulation":
-            self.climate_state['circulation'] = 'internal' if self.climate_state['circulation'] == 'external' else 'external'
-            button["active"] = self.climate_state['circulation'] == 'internal'
-            print(f"Air Circulation: {self.climate_state['circulation'].upper()}")
-            
-        elif action == "toggle_front_defrost":
-            self.climate_state['front_defrost'] = not self.climate_state['front_defrost']
-            button["active"] = self.climate_state['front_defrost']
-            print(f"Front Defrost: {'ON' if self.climate_state['front_defrost'] else 'OFF'}")
-            
+        
+        handler = self._actions.get(action)
+        if handler is not None:
+            handler(button)
         self.update_display_buttons()
+        self.mark_dirty()  # 상태 변경은 여러 버튼/HUD에 걸치므로 전체 다시 그리기
+    
+    def _toggle_left_seat_heat(self, button):
+        """좌측 시트 히터 단계 변경 (0-3 순환)"""
+        self.climate_state['left_seat_heat'] = (self.climate_state['left_seat_heat'] + 1) % 4
+        button["active"] = self.climate_state['left_seat_heat'] > 0
+        log.debug("Left Seat Heat: Level %d", self.climate_state['left_seat_heat'])
+    
+    def _toggle_right_seat_heat(self, button):
+        """우측 시트 히터 단계 변경 (0-3 순환)"""
+        self.climate_state['right_seat_heat'] = (self.climate_state['right_seat_heat'] + 1) % 4
+        button["active"] = self.climate_state['right_seat_heat'] > 0
+        log.debug("Right Seat Heat: Level %d", self.climate_state['right_seat_heat'])
+    
+    def _toggle_driver_only(self, button):
+        """운전석 전용 토글"""
+        self.climate_state['driver_only'] = not self.climate_state['driver_only']
+        button["active"] = self.climate_state['driver_only']
+        log.debug("Driver Only: %s", 'ON' if self.climate_state['driver_only'] else 'OFF')
+    
+    def _increase_fan(self, button):
+        """풍량 증가"""
+        if self.climate_state['fan_speed'] < 5:
+            self.climate_state['fan_speed'] += 1
+            log.debug("Fan Speed: %d", self.climate_state['fan_speed'])
+    
+    def _decrease_fan(self, button):
+        """풍량 감소"""
+        if self.climate_state['fan_speed'] > 1:
+            self.climate_state['fan_speed'] -= 1
+            log.debug("Fan Speed: %d", self.climate_state['fan_speed'])
+    
+    def _temp_control(self, button):
+        """온도 조절 (클릭할 때마다 +1, 30 다음은 16)"""
+        if self.climate_state['temperature'] < 30:
+            self.climate_state['temperature'] += 1
+        else:
+            self.climate_state['temperature'] = 16
+        log.debug("Temperature: %d°C", self.climate_state['temperature'])
+    
+    def _toggle_steering_heat(self, button):
+        """스티어링 휠 히터 토글"""
+        self.climate_state['steering_heat'] = not self.climate_state['steering_heat']
+        button["active"] = self.climate_state['steering_heat']
+        log.debug("Steering Wheel Heat: %s", 'ON' if self.climate_state['steering_heat'] else 'OFF')
+    
+    def _toggle_left_seat_cool(self, button):
+        """좌측 시트 쿨링 토글"""
+        self.climate_state['left_seat_cool'] = not self.climate_state['left_seat_cool']
+        button["active"] = self.climate_state['left_seat_cool']
+        log.debug("Left Seat Cool: %s", 'ON' if self.climate_state['left_seat_cool'] else 'OFF')
+    
+    def _toggle_right_seat_cool(self, button):
+        """우측 시트 쿨링 토글"""
+        self.climate_state['right_seat_cool'] = not self.climate_state['right_seat_cool']
+        button["active"] = self.climate_state['right_seat_cool']
+        log.debug("Right Seat Cool: %s", 'ON' if self.climate_state['right_seat_cool'] else 'OFF')
+    
+    def _toggle_system_off(self, button):
+        """모든 시스템 끄기"""
+        self.climate_state['ac_on'] = False
+        self.climate_state['heat_on'] = False
+        self.climate_state['auto_mode'] = False
+        self.update_all_buttons()
+        log.debug("System OFF - All functions disabled")
+    
+    def _toggle_ac(self, button):
+        """A/C 토글 (켜면 난방 끔)"""
+        self.climate_state['ac_on'] = not self.climate_state['ac_on']
+        button["active"] = self.climate_state['ac_on']
+        if self.climate_state['ac_on']:
+            self.climate_state['heat_on'] = False
+            self.update_button_active('heat', False)
+        log.debug("A/C: %s", 'ON' if self.climate_state['ac_on'] else 'OFF')
+    
+    def _toggle_circulation(self, button):
+        """내/외기 순환 전환"""
+        self.climate_state['circulation'] = 'internal' if self.climate_state['circulation'] == 'external' else 'external'
+        button["active"] = self.climate_state['circulation'] == 'internal'
+        log.debug("Air Circulation: %s", self.climate_state['circulation'].upper())
+    
+    def _toggle_front_defrost(self, button):
+        """앞유리 디프로스트 토글"""
+        self.climate_state['front_defrost'] = not self.climate_state['front_defrost']
+        button["active"] = self.climate_state['front_defrost']
+        log.debug("Front Defrost: %s", 'ON' if self.climate_state['front_defrost'] else 'OFF')
     
     def update_display_buttons(self):
         """디스플레이 버튼들 업데이트"""
@@ -399,69 +606,130 @@ class AutomotiveClimateGUI:
                 btn["active"] = active
                 break
     
-    def handle_mouse_move(self, pos):
-        """마우스 이동 처리"""
-        current_time = time.perf_counter()
+    def handle_mouse_move(self, pos, current_time=None):
+        """
+        마우스 이동 처리
+        
+        Parameters:
+        - current_time: 이벤트 배치 시각 (생략 시 perf_counter 호출)
+        """
+        if current_time is None:
+            current_time = time.perf_counter()
         
         # 버튼 hover 상태 확인
         self.prev_hovered_button = self.hovered_button
         self.hovered_button = None
         
-        for button in self.buttons:
-            if button["rect"].collidepoint(pos):
-                # 풍량 바는 hover 불가
-                if button.get("type") != "fan_display":
-                    self.hovered_button = button
-                break
+        button = self._hit_test(pos)
+        # 풍량 바는 hover 불가
+        if button is not None and button.get("type") != "fan_display":
+            self.hovered_button = button
         
         # 버튼 진입/이탈 감지
         if self.hovered_button != self.prev_hovered_button:
+            # 이전/현재 hover 버튼과 하단 HUD만 다시 그리기
+            if self.prev_hovered_button:
+                self.mark_dirty(self.prev_hovered_button["area"])
+            if self.hovered_button:
+                self.mark_dirty(self.hovered_button["area"])
+            self.mark_dirty(self._hud_bottom_rect)
             if self.hovered_button:
                 self.hover_start_time = current_time
                 self.hover_feedback_sent = False  # 새 버튼이므로 피드백 리셋
                 # 즉시 강한 hover 피드백 발생
-                self.send_hover_haptic_feedback()
-                print(f"⬆️ HOVER: {self.hovered_button['name']}")
+                self.send_hover_haptic_feedback(current_time)
+                log.debug("⬆️ HOVER: %s", self.hovered_button['name'])
             elif self.prev_hovered_button:
                 # 이탈 시 피드백
-                self.send_exit_haptic_feedback(self.prev_hovered_button['name'])
-                print(f"⬇️ EXIT: {self.prev_hovered_button['name']}")
+                self.send_exit_haptic_feedback(self.prev_hovered_button['name'], current_time)
+                log.debug("⬇️ EXIT: %s", self.prev_hovered_button['name'])
         
         # 마우스 속도 계산 (버튼 위에서만)
         if self.hovered_button and self.last_mouse_pos:
-            dx = pos[0] - self.last_mouse_pos[0]
-            dy = pos[1] - self.last_mouse_pos[1]
-            distance = np.sqrt(dx**2 + dy**2)
             dt = current_time - self.last_mouse_time
             
             if dt > self.min_mouse_delta_time:
-                self.mouse_speed = min(distance / dt, self.max_speed_clamp)
-                self.speed_history.append(self.mouse_speed)
-                self.avg_mouse_speed = np.mean(self.speed_history)
+                dx = pos[0] - self.last_mouse_pos[0]
+                dy = pos[1] - self.last_mouse_pos[1]
+                self.mouse_speed = min(math.hypot(dx, dy) / dt, self.max_speed_clamp)
+                hist, hi = self._speed_hist, self._speed_hi
+                sample = float(np.float32(self.mouse_speed))  # 버퍼에 저장되는 값과 같게 합산
+                self._speed_sum += sample - float(hist[hi])  # 덮어쓸 가장 오래된 값 제외 (빈 칸은 0)
+                hist[hi] = sample
+                self._speed_hi = (hi + 1) % hist.shape[0]
+                if self._speed_hn < hist.shape[0]:
+                    self._speed_hn += 1
+                self.avg_mouse_speed = self._speed_sum / self._speed_hn
                 
                 self.last_mouse_pos = pos
                 self.last_mouse_time = current_time
+                self._stop_deadline = current_time + self.mouse_stop_threshold
         elif not self.hovered_button:
             self.mouse_speed = 0.0
             self.avg_mouse_speed = 0.0
     
-    def update_haptic_system(self):
-        """햅틱 시스템 업데이트"""
-        if (time.perf_counter() - self.last_mouse_time) > self.mouse_stop_threshold:
-            self.mouse_speed = 0.0
+    def _publish_haptic_sample(self):
+        """현재 마우스 상태를 햅틱 스레드에 전달 (이전 샘플은 덮어씀)"""
+        with self._haptic_cv:
+            self._hsample = (self.hovered_button is not None, self.mouse_speed,
+                             self.avg_mouse_speed, self._stop_deadline)
+            self._haptic_cv.notify()
+    
+    def update_haptic_system(self, mouse_speed, avg_mouse_speed, stop_deadline):
+        """햅틱 시스템 1스텝 업데이트 (햅틱 스레드에서 GUI가 발행한 최신 샘플로 호출)"""
+        if time.perf_counter() > stop_deadline:
+            mouse_speed = 0.0
         
-        # 버튼 위에서만 햅틱 피드백
-        if self.hovered_button:
-            self.haptic_system.step(
-                mouse_speed=self.mouse_speed,
-                avg_mouse_speed=self.avg_mouse_speed
-            )
+        with self._haptic_lock:
+            self.haptic_system.step(mouse_speed, avg_mouse_speed)
+    
+    def _haptic_loop(self):
+        """
+        햅틱 스레드 본체 (소비자)
+        
+        버튼 위에 있을 때는 perf_counter 기준 고정 주기로 최신 샘플을 step,
+        hover가 없으면 GUI가 새 샘플을 발행할 때까지 Condition에서 대기
+        """
+        period = self._haptic_period
+        cv = self._haptic_cv
+        next_time = time.perf_counter()
+        while True:
+            with cv:
+                # 버튼 위에서만 햅틱 피드백 (hover 없으면 잠듦)
+                while self._haptic_running and not self._hsample[0]:
+                    cv.wait()
+                    next_time = time.perf_counter()
+                if not self._haptic_running:
+                    break
+                _, mouse_speed, avg_mouse_speed, stop_deadline = self._hsample
+            
+            self.update_haptic_system(mouse_speed, avg_mouse_speed, stop_deadline)
+            
+            next_time += period
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_time = time.perf_counter()  # 밀린 스텝은 몰아서 따라잡지 않음
+    
+    def _start_haptic_thread(self):
+        """햅틱 스레드 시작"""
+        self._haptic_running = True
+        self._haptic_thread = threading.Thread(target=self._haptic_loop, daemon=True)
+        self._haptic_thread.start()
+    
+    def _stop_haptic_thread(self):
+        """햅틱 스레드 종료 대기"""
+        with self._haptic_cv:
+            self._haptic_running = False
+            self._haptic_cv.notify_all()
+        if self._haptic_thread is not None:
+            self._haptic_thread.join(timeout=1.0)
+            self._haptic_thread = None
     
     def draw_hud(self):
         """HUD 정보 표시"""
-        # 제목
-        title = self.font_large.render("Vehicle Climate Control System", True, self.WHITE)
-        self.screen.blit(title, (50, 30))
+        # 제목은 배경 Surface(_bg)에 미리 그려져 있음
         
         # 현재 상태 요약
         mode_text = []
@@ -475,12 +743,12 @@ class AutomotiveClimateGUI:
             mode_text.append("OFF")
             
         status = f"Mode: {', '.join(mode_text)} | Temp: {self.climate_state['temperature']}°C | Fan: {self.climate_state['fan_speed']}"
-        status_surface = self.font_medium.render(status, True, self.WHITE)
+        status_surface = self._render(status, self.font_medium, self.WHITE)
         self.screen.blit(status_surface, (50, 80))
         
         # 시트 상태
         seat_status = f"Seats - L.Heat:{self.climate_state['left_seat_heat']} L.Cool:{'ON' if self.climate_state['left_seat_cool'] else 'OFF'} | R.Heat:{self.climate_state['right_seat_heat']} R.Cool:{'ON' if self.climate_state['right_seat_cool'] else 'OFF'}"
-        seat_surface = self.font_small.render(seat_status, True, self.GRAY_INACTIVE)
+        seat_surface = self._render(seat_status, self.font_small, self.GRAY_INACTIVE)
         self.screen.blit(seat_surface, (50, 110))
         
         # Hover 상태
@@ -491,76 +759,153 @@ class AutomotiveClimateGUI:
             hover_info = "Move cursor over buttons for haptic feedback"
             hover_color = self.GRAY_INACTIVE
             
-        hover_text = self.font_small.render(hover_info, True, hover_color)
+        hover_text = self._render(hover_info, self.font_small, hover_color)
         self.screen.blit(hover_text, (50, self.height - 60))
         
         # 햅틱 상태
         haptic_text = f"Haptic Feedback: {'ACTIVE' if self.hovered_button else 'STANDBY'}"
-        haptic_surface = self.font_small.render(haptic_text, True, 
-                                              self.GREEN_ACTIVE if self.hovered_button else self.GRAY_INACTIVE)
+        haptic_surface = self._render(haptic_text, self.font_small,
+                                      self.GREEN_ACTIVE if self.hovered_button else self.GRAY_INACTIVE)
         self.screen.blit(haptic_surface, (50, self.height - 30))
     
     def draw(self):
-        """화면 그리기"""
-        self.screen.fill(self.BLACK)
-        
-        # HUD 그리기
-        self.draw_hud()
-        
-        # 버튼들 그리기
-        for button in self.buttons:
-            self.draw_button(button)
+        """
+        화면 그리기 (더티 영역만)
+        
+        Returns:
+        - list: 다시 그린 영역 (pygame.display.update 대상, 변경 없으면 빈 리스트)
+        """
+        if not self._dirty:
+            return []
+        
+        # 루프에서 반복 참조하는 속성은 지역 변수로
+        screen = self.screen
+        buttons = self.buttons
+        bg = self._bg
+        hud_top_rect, hud_bottom_rect = self._hud_top_rect, self._hud_bottom_rect
+        is_overlay = self._is_overlay
+        draw_button = self.draw_button
+        black = self.BLACK
+        
+        dirty_rects = self._dirty_rects
+        for rect in dirty_rects:
+            # 영역 밖으로 번지지 않도록 클리핑한 뒤 배경을 복원하고 겹치는 요소만 다시 그리기
+            screen.set_clip(rect)
+            screen.blit(bg, rect, rect)
+            
+            # HUD 그리기
+            if rect.colliderect(hud_top_rect) or rect.colliderect(hud_bottom_rect):
+                self.draw_hud()
+            
+            # 배경과 다르게 보이는 버튼들만 덧그리기 (배경의 비활성 모습은 먼저 지움)
+            overlay = [button for button in buttons
+                       if rect.colliderect(button["area"]) and is_overlay(button)]
+            for button in overlay:
+                if button["in_bg"]:
+                    screen.fill(black, button["area"])
+            for button in overlay:
+                draw_button(button)
+        screen.set_clip(None)
+        
+        self._dirty_rects = []
+        self._dirty = False
+        return dirty_rects
     
     def run(self):
         """메인 실행 루프"""
         print("Starting vehicle climate control system...")
         running = True
+        self._start_haptic_thread()
+        
+        # 루프에서 매번 참조하는 함수/상수는 지역 변수로
+        event_wait = pygame.event.wait
+        event_get = pygame.event.get
+        perf_counter = time.perf_counter
+        handle_mouse_move = self.handle_mouse_move
+        NOEVENT, QUIT, KEYDOWN = pygame.NOEVENT, pygame.QUIT, pygame.KEYDOWN
+        MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP = pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP
+        EXPOSE_EVENTS = frozenset(_EXPOSE_EVENTS)
         
         while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            # 이벤트가 올 때까지 잠들었다가(최대 16ms) 쌓인 처리 대상 이벤트를 한 번에 가져오기
+            first_event = event_wait(16)
+            events = event_get(_HANDLED_EVENTS, pump=False)
+            if first_event.type != NOEVENT:
+                events.insert(0, first_event)
+            now = perf_counter()  # 배치 전체에 같은 시각 사용 (이벤트별 호출 없음)
+            motion_pos = None  # 이번 배치의 마지막 MOUSEMOTION 위치 (이동 이벤트는 1개로 합침)
+            full_redraw = False  # 창 노출/복원 시 화면 전체 갱신
+            for event in events:
+                event_type = event.type
+                if event_type == MOUSEMOTION:
+                    motion_pos = event.pos
+                    continue
+                if event_type in EXPOSE_EVENTS:
+                    # 이동 합치기에는 영향 없이 전체 다시 그리기만 예약
+                    full_redraw = True
+                    continue
+                
+                # 클릭/해제 전에는 그때까지의 이동을 먼저 반영 (hover 상태 최신화)
+                if motion_pos is not None and (event_type == MOUSEBUTTONDOWN or event_type == MOUSEBUTTONUP):
+                    handle_mouse_move(motion_pos, now)
+                    motion_pos = None
+                
+                if event_type == QUIT:
                     running = False
-                elif event.type == pygame.KEYDOWN:
+                elif event_type == KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         running = False
-                elif event.type == pygame.MOUSEBUTTONDOWN:
+                elif event_type == MOUSEBUTTONDOWN:
                     if event.button == 1:
                         self.mouse_pressed = True
                         self.last_mouse_pos = event.pos
-                        self.last_mouse_time = time.perf_counter()
+                        self.last_mouse_time = now
+                        self._stop_deadline = now + self.mouse_stop_threshold
                         self.mouse_speed = 0.0
-                        self.speed_history.clear()
+                        self._speed_hist.fill(0.0)
+                        self._speed_hi = 0
+                        self._speed_hn = 0
+                        self._speed_sum = 0.0
                         self.avg_mouse_speed = 0.0
                         
                         if self.hovered_button:
-                            self.haptic_system.mouse_press()
+                            with self._haptic_lock:
+                                self.haptic_system.mouse_press()
                         
                         # 클릭 처리 (풍량 바는 클릭 불가)
-                        for button in self.buttons:
-                            if button["rect"].collidepoint(event.pos):
-                                if button.get("type") != "fan_display":  # 풍량 바 클릭 방지
-                                    self.handle_button_action(button)
-                                break
+                        button = self._hit_test(event.pos)
+                        if button is not None and button.get("type") != "fan_display":  # 풍량 바 클릭 방지
+                            self.handle_button_action(button)
                         
-                elif event.type == pygame.MOUSEBUTTONUP:
+                elif event_type == MOUSEBUTTONUP:
                     if event.button == 1:
                         self.mouse_pressed = False
                         self.mouse_speed = 0.0
-                        self.haptic_system.mouse_release()
-                        
-                elif event.type == pygame.MOUSEMOTION:
-                    self.handle_mouse_move(event.pos)
+                        with self._haptic_lock:
+                            self.haptic_system.mouse_release()
+            
+            # 합쳐진 마우스 이동을 배치당 1회만 처리
+            if motion_pos is not None:
+                handle_mouse_move(motion_pos, now)
             
-            # 햅틱 시스템 업데이트
-            self.update_haptic_system()
+            # 디바운스로 밀린 hover 펄스는 간격이 지난 뒤 다시 시도 (마우스가 멈춰 있어도 16ms마다 확인)
+            if self.hovered_button is not None and not self.hover_feedback_sent:
+                self.send_hover_haptic_feedback(now)
             
-            # 화면 그리기
-            self.draw()
+            # 배치 처리 결과(hover/속도)를 햅틱 스레드로 발행
+            if events:
+                self._publish_haptic_sample()
             
-            pygame.display.flip()
-            self.clock.tick(60)
+            # 화면 그리기 (변경이 있을 때만, 변경된 영역만 화면에 반영)
+            if full_redraw:
+                self.mark_dirty()
+                self.draw()
+                pygame.display.flip()
+            elif self._dirty:
+                pygame.display.update(self.draw())
         
         # 정리
+        self._stop_haptic_thread()
         self.haptic_system.cleanup()
         pygame.quit()
         print("Vehicle climate control terminated")
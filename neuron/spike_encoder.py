@@ -4,6 +4,72 @@ SA(Slowly Adapting) 뉴런, RA(Rapidly Adapting) 움직임 뉴런, RA 클릭 뉴
 '''
 from .izhikevich_neuron import IzhikevichNeuronArray
 import numpy as np
+from utils.jit import njit
+
+
+# state_arr 열 인덱스 (뉴런별 행: 0=SA, 1=RA 움직임, 2=RA 클릭)
+V, U, A, I_EXT = 0, 1, 2, 3
+# params_arr 열 인덱스
+B, C, D = 0, 1, 2
+
+
+@njit(cache=True)  # fastmath 미사용: 식 재배열 시 스파이크 타이밍이 기존 뉴런 계산과 달라짐
+def _step_neurons(state, params, dt, sa_adapt):
+    """
+    3개 뉴런을 한 스텝 적분 (state는 제자리 갱신, 입력은 state[:, I_EXT])
+    
+    Parameters:
+    - state: 뉴런 상태 배열 [v, u, a, I] (shape: 3 x 4)
+    - params: 뉴런 파라미터 배열 [b, c, d] (shape: 3 x 3)
+    - dt: 시간 간격 (ms)
+    - sa_adapt: SA 스파이크 시 a를 나누는 적응 계수
+    
+    Returns:
+    - fired: 스파이크 비트마스크 (bit0=SA, bit1=RA 움직임, bit2=RA 클릭)
+    """
+    fired = 0
+    for i in range(state.shape[0]):
+        v = state[i, V]
+        u = state[i, U]
+        v += dt * (0.04 * (v * v) + 5.0 * v + 140.0 - u + state[i, I_EXT])
+        u += dt * (state[i, A] * (params[i, B] * v - u))
+        if v >= 30.0:
+            v = params[i, C]
+            u += params[i, D]
+            fired |= 1 << i
+        state[i, V] = v
+        state[i, U] = u
+    if fired & 1:
+        state[0, A] /= sa_adapt
+    return fired
+
+
+@njit(cache=True)  # fastmath 미사용 (_step_neurons와 동일한 이유)
+def _run_neurons(state, params, dt, I, sa_adapt):
+    """
+    3개 뉴런을 T 스텝 연속 적분 (배치 처리용, state는 제자리 갱신)
+    
+    Parameters:
+    - state, params, dt, sa_adapt: _step_neurons와 동일
+    - I: 스텝별 입력 전류 (shape: T x 3)
+    
+    Returns:
+    - fired: 스텝별 스파이크 여부 (shape: T x 3)
+    - states: 스텝별 (v, u) (shape: T x 3 x 2)
+    """
+    n_steps = I.shape[0]
+    n_neurons = state.shape[0]
+    fired = np.zeros((n_steps, n_neurons), dtype=np.bool_)
+    states = np.empty((n_steps, n_neurons, 2))
+    for t in range(n_steps):
+        for i in range(n_neurons):
+            state[i, I_EXT] = I[t, i]
+        mask = _step_neurons(state, params, dt, sa_adapt)
+        for i in range(n_neurons):
+            fired[t, i] = (mask >> i) & 1 == 1
+            states[t, i, 0] = state[i, V]
+            states[t, i, 1] = state[i, U]
+    return fired, states
 
 class SpikeEncoder:
     """
@@ -34,6 +100,19 @@ class SpikeEncoder:
         
         self.neuron_array = IzhikevichNeuronArray(neuron_params)
         
+        # 뉴런 상태를 연속 메모리 배열로 통합 (JIT 커널이 직접 갱신)
+        # neuron_array의 v/u/a는 이 배열의 열 뷰로 연결해 두 표현이 항상 일치하도록 유지
+        arr = self.neuron_array
+        self.state_arr = np.zeros((arr.n_neurons, 4), dtype=np.float64)
+        self.state_arr[:, V] = arr.v
+        self.state_arr[:, U] = arr.u
+        self.state_arr[:, A] = arr.a
+        arr.v = self.state_arr[:, V]
+        arr.u = self.state_arr[:, U]
+        arr.a = self.state_arr[:, A]
+        self.params_arr = np.ascontiguousarray(np.stack([arr.b, arr.c, arr.d], axis=1), dtype=np.float64)
+        self._dt = float(neuron_dt_ms)
+        
         # 입력 관련 변수들
         self.input_mag_sa = 0.0
         self.prev_input_mag_sa = 0.0
@@ -48,7 +127,7 @@ class SpikeEncoder:
 
     def step(self, mouse_speed, avg_mouse_speed, material_roughness, mouse_pressed):
         """
-        병렬화된 뉴런 시뮬레이션 스텝 (3x 속도 향상)
+        뉴런 시뮬레이션 스텝 (입력 계산은 스칼라, 적분은 state_arr 위의 JIT 커널)
         """
         # === RA 클릭 입력 계산 ===
         input_delta_sa = self.input_mag_sa - self.prev_input_mag_sa
@@ -71,30 +150,75 @@ class SpikeEncoder:
         if mouse_pressed and mouse_speed > min_spd_for_ra:
             ra_motion_I = (mouse_speed * material_roughness) * self.input_config['ra_motion_scl_spd_dev']
             
-        # === 입력 배열 준비 (3개 뉴런용) ===
-        I_array = np.array([
-            self.input_mag_sa,  # SA 뉴런 입력
-            np.clip(ra_motion_I, self.input_config['ra_motion_clip_min'], self.input_config['ra_motion_clip_max']),  # RA 움직임 입력
-            np.clip(current_ra_click_input, self.input_config['ra_click_clip_min'], self.input_config['ra_click_clip_max'])  # RA 클릭 입력
-        ])
+        # === 입력 설정 (3개 뉴런용, 스칼라 클램핑) ===
+        cfg = self.input_config
+        state = self.state_arr
+        state[0, I_EXT] = self.input_mag_sa  # SA 뉴런 입력
+        state[1, I_EXT] = min(max(ra_motion_I, cfg['ra_motion_clip_min']), cfg['ra_motion_clip_max'])  # RA 움직임 입력
+        state[2, I_EXT] = min(max(current_ra_click_input, cfg['ra_click_clip_min']), cfg['ra_click_clip_max'])  # RA 클릭 입력
         
-        # === 병렬 뉴런 시뮬레이션 (한 번에 3개 처리) ===
-        fired_array = self.neuron_array.step(self.neuron_dt_ms, I_array)
-        states = self.neuron_array.get_states()
-        
-        # SA 적응 처리
-        if fired_array[0]:  # SA 뉴런이 스파이크 발생
-            self.neuron_array.a[0] /= 1.05
+        # === JIT 뉴런 시뮬레이션 (한 번에 3개 처리, SA 적응 포함) ===
+        fired = _step_neurons(state, self.params_arr, self._dt, 1.05)
         
         return (
-            bool(fired_array[0]),  # SA fired
-            bool(fired_array[1]),  # RA motion fired  
-            bool(fired_array[2]),  # RA click fired
-            states[0],  # SA (v, u)
-            states[1],  # RA motion (v, u)
-            states[2]   # RA click (v, u)
+            bool(fired & 1),  # SA fired
+            bool(fired & 2),  # RA motion fired  
+            bool(fired & 4),  # RA click fired
+            (state[0, V], state[0, U]),  # SA (v, u)
+            (state[1, V], state[1, U]),  # RA motion (v, u)
+            (state[2, V], state[2, U])   # RA click (v, u)
         )
 
+    def step_many(self, mouse_speeds, avg_mouse_speeds, material_roughness, mouse_pressed):
+        """
+        여러 스텝을 한 번에 처리하는 배치 버전 (오프라인 분석/회귀 테스트용)
+        
+        step()을 len(mouse_speeds)번 호출한 것과 같은 결과. 배치 동안 SA 입력
+        (update_sa_input)과 재질/클릭 상태는 고정된 것으로 간주.
+        
+        Parameters:
+        - mouse_speeds, avg_mouse_speeds: 스텝별 마우스 속도 배열 (shape: T)
+        - material_roughness: 재질 거칠기
+        - mouse_pressed: 마우스 클릭 여부
+        
+        Returns:
+        - fired: 스텝별 스파이크 여부 [SA, RA motion, RA click] (bool, shape: T x 3)
+        - states: 스텝별 뉴런 (v, u) (shape: T x 3 x 2)
+        """
+        speeds = np.asarray(mouse_speeds, dtype=np.float64)
+        n_steps = speeds.shape[0]
+        I = np.empty((n_steps, 3))
+        
+        # === SA 입력 (배치 동안 고정) ===
+        I[:, 0] = self.input_mag_sa
+        
+        # === RA 움직임 입력 (벡터화) ===
+        min_spd_for_ra = self.input_config.get('ra_min_spd_for_input', 1.0)
+        if mouse_pressed:
+            ra_motion_I = np.where(speeds > min_spd_for_ra,
+                                   speeds * material_roughness * self.input_config['ra_motion_scl_spd_dev'], 0.0)
+        else:
+            ra_motion_I = np.zeros(n_steps)
+        I[:, 1] = np.clip(ra_motion_I, self.input_config['ra_motion_clip_min'], self.input_config['ra_motion_clip_max'])
+        
+        # === RA 클릭 입력 (입력 변화는 첫 스텝에서만 발생) ===
+        input_delta_sa = self.input_mag_sa - self.prev_input_mag_sa
+        if abs(input_delta_sa) > 0.1:
+            self.ra_click_sustained_input = abs(input_delta_sa) * self.input_config['ra_click_scl_chg']
+            self.ra_click_sustain_counter = self.input_config['RA_CLICK_SUSTAIN_DURATION']
+        self.prev_input_mag_sa = self.input_mag_sa
+        
+        ra_click_I = np.zeros(n_steps)
+        n_sustain = min(self.ra_click_sustain_counter, n_steps)
+        ra_click_I[:n_sustain] = self.ra_click_sustained_input
+        self.ra_click_sustain_counter -= n_sustain
+        if n_sustain > 0 and self.ra_click_sustain_counter == 0:
+            self.ra_click_sustained_input = 0.0
+        I[:, 2] = np.clip(ra_click_I, self.input_config['ra_click_clip_min'], self.input_config['ra_click_clip_max'])
+        
+        # === 뉴런 적분 (컴파일된 루프) ===
+        return _run_neurons(self.state_arr, self.params_arr, self._dt, I, 1.05)
+
 # 테스트 코드
 if __name__ == '__main__':
     """
@@ -0,0 +1,10 @@
+"""
+Utils Package - 공용 보조 모듈
+
+이 패키지는 여러 패키지가 함께 쓰는 보조 기능들을 포함합니다:
+- jit: numba njit 래퍼 (numba 미설치 시 일반 파이썬 함수로 실행)
+"""
+
+from .jit import njit, NUMBA_AVAILABLE
+
+__all__ = ['njit', 'NUMBA_AVAILABLE']
@@ -0,0 +1,17 @@
+'''
+JIT Helper - numba 선택적 사용
+
+numba가 설치되어 있으면 numba.njit를 그대로 쓰고,
+없으면 데코레이터를 무시하고 일반 파이썬 함수로 실행
+'''
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba 미설치 시 일반 파이썬 함수로 실행
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func